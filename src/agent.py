@@ -53,9 +53,7 @@ async def search_knowledge_base(
         String containing the retrieved information formatted for the LLM
     """
     try:
-        # Get project_id from deps if available
-        deps = ctx.deps
-        project_id = getattr(deps, 'project_id', None) or getattr(deps, 'project_id', None)
+        project_id = ctx.deps.project_id
 
         # Perform the search based on type
         if search_type == "hybrid":
@@ -85,13 +83,11 @@ async def search_knowledge_base(
             return "No relevant information found in the knowledge base."
 
         # Build a formatted response
-        response_parts = [f"Found {len(results)} relevant documents:\n"]
-
-        for i, result in enumerate(results, 1):
-            response_parts.append(f"\n--- Document {i}: {result.document_title} (relevance: {result.similarity:.2f}) ---")
-            response_parts.append(result.content)
-
-        return "\n".join(response_parts)
+        body = "\n".join(
+            f"\n--- Document {i}: {result.document_title} (relevance: {result.similarity:.2f}) ---\n{result.content}"
+            for i, result in enumerate(results, 1)
+        )
+        return f"Found {len(results)} relevant documents:\n\n{body}"
 
     except Exception as e:
         return f"Error searching knowledge base: {str(e)}"
@@ -121,8 +117,6 @@ async def search_by_entity_name(
         String containing the documents that mention the entity
     """
     try:
-        deps = ctx.deps
-
         # Search by entity
         results = await search_by_entity(
             ctx=ctx,
@@ -167,8 +161,6 @@ async def find_related_by_entity(
         String containing related documents with relationship info
     """
     try:
-        deps = ctx.deps
-
         # Find related documents
         results = await find_related_documents(
             ctx=ctx,
@@ -213,8 +205,6 @@ async def find_document_relations(
         String containing the relations found with document titles and relationship types
     """
     try:
-        deps = ctx.deps
-
         # Search relations by entity
         results = await search_relations_by_entity(
             ctx=ctx,
@@ -1,11 +1,17 @@
 """FastAPI dependencies for dependency injection."""
 
-from typing import AsyncGenerator, Optional
+import asyncio
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status, Request
 from pathlib import Path
 
 from src.settings import Settings, load_settings
-from src.dependencies import db_pool_context, AgentDependencies
+from src.dependencies import AgentDependencies
 from src.api.models.auth import User
 import asyncpg
 
@@ -14,6 +20,17 @@ import asyncpg
 # SETTINGS DEPENDENCY
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def _load_cached_settings() -> Settings:
+    """Load settings once per process; failures are not cached."""
+    return load_settings()
+
+
+def clear_settings_cache() -> None:
+    """Drop cached settings so the next request reloads them."""
+    _load_cached_settings.cache_clear()
+
+
 async def get_settings() -> Settings:
     """
     Get application settings.
@@ -25,7 +42,7 @@ async def get_settings() -> Settings:
         HTTPException: If settings cannot be loaded
     """
     try:
-        return load_settings()
+        return _load_cached_settings()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -37,19 +54,79 @@ async def get_settings() -> Settings:
 # DATABASE POOL DEPENDENCY
 # ============================================================================
 
-async def get_db_pool(settings: Settings = Depends(get_settings)):
+# One pool for the whole application: connections (and their prepared
+# statement caches) outlive individual requests.
+_db_pool: Optional[asyncpg.Pool] = None
+_db_pool_lock = asyncio.Lock()
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Exchange JSONB values as Python objects instead of JSON strings."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=json.dumps,
+        decoder=json.loads,
+        schema="pg_catalog"
+    )
+
+
+def _db_pool_size(settings: Settings) -> int:
+    """Connections to keep open: DB_POOL_SIZE, else 2 * CPU cores + 1."""
+    return settings.db_pool_size or 2 * (os.cpu_count() or 1) + 1
+
+
+async def init_db_pool(settings: Settings) -> asyncpg.Pool:
+    """
+    Create the application-wide database pool if it does not exist yet.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        asyncpg.Pool: Shared database connection pool
+    """
+    global _db_pool
+    async with _db_pool_lock:
+        if _db_pool is None:
+            # Fixed-size pool that never retires idle connections, so
+            # requests always acquire a warm connection
+            pool_size = _db_pool_size(settings)
+            _db_pool = await asyncpg.create_pool(
+                settings.database_url,
+                min_size=pool_size,
+                max_size=pool_size,
+                max_inactive_connection_lifetime=0,
+                command_timeout=60,
+                statement_cache_size=1024,
+                max_cached_statement_lifetime=0,
+                init=_init_connection
+            )
+    return _db_pool
+
+
+async def close_db_pool() -> None:
+    """Close the application-wide database pool."""
+    global _db_pool
+    if _db_pool is not None:
+        await _db_pool.close()
+        _db_pool = None
+
+
+async def get_db_pool(settings: Settings = Depends(get_settings)) -> asyncpg.Pool:
     """
     Get database connection pool.
 
-    Yields:
-        asyncpg.Pool: Database connection pool
+    Returns:
+        asyncpg.Pool: Shared database connection pool
 
     Raises:
         HTTPException: If database connection fails
     """
+    if _db_pool is not None:
+        return _db_pool
+
     try:
-        async with db_pool_context(settings.database_url) as pool:
-            yield pool
+        return await init_db_pool(settings)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -64,7 +141,8 @@ async def get_db_pool(settings: Settings = Depends(get_settings)):
 async def get_agent_dependencies(
     project_id: str,
     session_id: str,
-    settings: Settings = Depends(get_settings)
+    settings: Settings = Depends(get_settings),
+    pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> AsyncGenerator[AgentDependencies, None]:
     """
     Get agent dependencies with project context.
@@ -73,6 +151,7 @@ async def get_agent_dependencies(
         project_id: Project UUID
         session_id: Session UUID
         settings: Application settings
+        pool: Shared database connection pool
 
     Yields:
         AgentDependencies: Initialized agent dependencies
@@ -81,6 +160,7 @@ async def get_agent_dependencies(
         HTTPException: If dependencies cannot be initialized
     """
     deps = AgentDependencies(
+        db_pool=pool,
         project_id=project_id,
         session_id=session_id,
         settings=settings
@@ -102,16 +182,18 @@ async def get_agent_dependencies(
 # PATH VALIDATION
 # ============================================================================
 
+# Created once at startup by the application lifespan
+UPLOADS_DIR = Path("uploads").resolve()
+
+
 def ensure_uploads_dir() -> Path:
     """
-    Ensure uploads directory exists.
+    Get the uploads directory (created at application startup).
 
     Returns:
         Path: Uploads directory path
     """
-    uploads_dir = Path("uploads")
-    uploads_dir.mkdir(exist_ok=True)
-    return uploads_dir
+    return UPLOADS_DIR
 
 
 # ============================================================================
@@ -128,10 +210,97 @@ def hashlib_sha256(data: str) -> str:
     Returns:
         Hexadecimal hash string
     """
-    import hashlib
     return hashlib.sha256(data.encode()).hexdigest()
 
 
+# Validated sessions are cached briefly so authenticated requests skip the
+# session lookup query. Logout evicts the entry in this process.
+SESSION_CACHE_TTL_SECONDS = 30
+SESSION_CACHE_MAX_SIZE = 10_000
+
+_session_cache: Dict[str, Tuple[User, float]] = {}
+_session_lookups: Dict[str, "asyncio.Task[Optional[User]]"] = {}
+
+
+async def lookup_session_user(pool: asyncpg.Pool, token_hash: str) -> Optional[User]:
+    """
+    Resolve a session token hash to its user, using a short-lived cache.
+
+    Args:
+        pool: Database connection pool
+        token_hash: SHA256 hash of the session token
+
+    Returns:
+        Session owner, or None if the session is invalid or expired
+    """
+    cached = _session_cache.get(token_hash)
+    if cached is not None:
+        user, valid_until = cached
+        if time.monotonic() < valid_until:
+            return user
+        _session_cache.pop(token_hash, None)
+
+    # Concurrent lookups of the same token (e.g. several tabs verifying on
+    # load) share one query
+    lookup = _session_lookups.get(token_hash)
+    if lookup is None:
+        lookup = asyncio.create_task(_fetch_session_user(pool, token_hash))
+        _session_lookups[token_hash] = lookup
+        lookup.add_done_callback(lambda task: _forget_session_lookup(token_hash, task))
+
+    return await asyncio.shield(lookup)
+
+
+async def _fetch_session_user(pool: asyncpg.Pool, token_hash: str) -> Optional[User]:
+    """Query the session owner and cache it if the session is valid."""
+    row = await pool.fetchrow(
+        """SELECT u.id::text AS id, u.username, u.created_at, u.updated_at,
+                  EXTRACT(EPOCH FROM us.expires_at - NOW())::float8 AS expires_in
+           FROM user_sessions us
+           JOIN users u ON us.user_id = u.id
+           WHERE us.token_hash = $1 AND us.expires_at > NOW()""",
+        token_hash
+    )
+
+    if not row:
+        return None
+
+    user = User.model_validate(dict(row))
+
+    # A logout while the query ran detaches this lookup; its row may predate
+    # the DELETE, so don't cache it
+    if _session_lookups.get(token_hash) is not asyncio.current_task():
+        return user
+
+    # Evict the oldest entry when full; never cache past the session's expiry
+    if len(_session_cache) >= SESSION_CACHE_MAX_SIZE:
+        _session_cache.pop(next(iter(_session_cache)), None)
+    ttl = min(SESSION_CACHE_TTL_SECONDS, row["expires_in"])
+    _session_cache[token_hash] = (user, time.monotonic() + ttl)
+
+    return user
+
+
+def _forget_session_lookup(token_hash: str, task: "asyncio.Task[Optional[User]]") -> None:
+    """Remove a finished lookup unless a newer one has taken its place."""
+    if _session_lookups.get(token_hash) is task:
+        del _session_lookups[token_hash]
+
+
+def invalidate_session(token_hash: str) -> None:
+    """
+    Drop a session from the lookup cache.
+
+    Call after the session row is deleted. Lookups still in flight are
+    detached so they can't cache the session again when they finish.
+
+    Args:
+        token_hash: SHA256 hash of the session token
+    """
+    _session_cache.pop(token_hash, None)
+    _session_lookups.pop(token_hash, None)
+
+
 async def get_current_user(
     request: Request,
     pool: asyncpg.Pool = Depends(get_db_pool)
@@ -159,28 +328,15 @@ async def get_current_user(
         )
 
     token_hash = hashlib_sha256(session_token)
+    user = await lookup_session_user(pool, token_hash)
 
-    # Look up session with user
-    row = await pool.fetchrow(
-        """SELECT u.id, u.username, u.created_at, u.updated_at
-           FROM user_sessions us
-           JOIN users u ON us.user_id = u.id
-           WHERE us.token_hash = $1 AND us.expires_at > NOW()""",
-        token_hash
-    )
-
-    if not row:
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session"
         )
 
-    return User(
-        id=str(row["id"]),
-        username=row["username"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"]
-    )
+    return user
 
 
 async def get_current_user_optional(
@@ -197,7 +353,9 @@ async def get_current_user_optional(
     Returns:
         Current user or None if not authenticated
     """
-    try:
-        return await get_current_user(request, pool)
-    except HTTPException:
+    session_token = request.cookies.get("session_token")
+
+    if not session_token:
         return None
+
+    return await lookup_session_user(pool, hashlib_sha256(session_token))
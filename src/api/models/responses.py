@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from uuid import UUID
 
 
 # ============================================================================
@@ -26,7 +27,7 @@ class Project(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(..., description="Project ID")
+    id: UUID = Field(..., description="Project ID")
     name: str = Field(..., description="Project name")
     description: Optional[str] = Field(None, description="Project description")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -44,8 +45,8 @@ class Session(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(..., description="Session ID")
-    project_id: str = Field(..., description="Project ID")
+    id: UUID = Field(..., description="Session ID")
+    project_id: UUID = Field(..., description="Project ID")
     title: str = Field(..., description="Session title")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
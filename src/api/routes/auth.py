@@ -1,15 +1,23 @@
 """Authentication routes for login, logout, and user management."""
 
+import asyncio
 import logging
 import secrets
 import bcrypt
-from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from src.api.models.auth import User, UserLogin, LoginResponse, TokenResponse, UserSettings, UserSettingsUpdate
-from src.api.dependencies import get_db_pool
+from src.api.dependencies import (
+    get_db_pool,
+    get_current_user as get_current_user_dep,
+    hashlib_sha256,
+    lookup_session_user,
+    invalidate_session
+)
+from src.api.utils import make_etag, not_modified, etag_headers
 from src.settings import Settings
 import asyncpg
 
@@ -22,79 +30,6 @@ security = HTTPBearer(auto_error=False)
 SESSION_EXPIRE_DAYS = 30
 
 
-# ============================================================================
-# UTILITY FUNCTIONS
-# ============================================================================
-
-def hashlib_sha256(data: str) -> str:
-    """
-    Calculate SHA256 hash of string.
-
-    Args:
-        data: String to hash
-
-    Returns:
-        Hexadecimal hash string
-    """
-    import hashlib
-    return hashlib.sha256(data.encode()).hexdigest()
-
-
-# ============================================================================
-# DEPENDENCY: GET CURRENT USER
-# ============================================================================
-
-async def get_current_user_dep(
-    request: Request,
-    pool: asyncpg.Pool = Depends(get_db_pool)
-) -> User:
-    """
-    Dependency to get current authenticated user from session cookie.
-
-    Args:
-        request: FastAPI request
-        pool: Database connection pool
-
-    Returns:
-        Current user
-
-    Raises:
-        HTTPException: If not authenticated
-    """
-    # Get session token from cookie
-    session_token = request.cookies.get("session_token")
-
-    if not session_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-
-    token_hash = hashlib_sha256(session_token)
-
-    # Look up session with user
-    row = await pool.fetchrow(
-        """SELECT u.id, u.username, u.created_at, u.updated_at
-           FROM user_sessions us
-           JOIN users u ON us.user_id = u.id
-           WHERE us.token_hash = $1 AND us.expires_at > NOW()""",
-        token_hash
-    )
-
-    if not row:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired session"
-        )
-
-    return User(
-        id=str(row["id"]),
-        username=row["username"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"]
-    )
-
-
 # ============================================================================
 # LOGIN
 # ============================================================================
@@ -140,7 +75,8 @@ async def login(
 
         password_bytes = credentials.password.encode('utf-8')
 
-        if not bcrypt.checkpw(password_bytes, stored_hash):
+        # bcrypt is deliberately slow; run it off the event loop
+        if not await asyncio.to_thread(bcrypt.checkpw, password_bytes, stored_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
@@ -150,14 +86,11 @@ async def login(
         session_token = secrets.token_urlsafe(32)
         token_hash = hashlib_sha256(session_token)
 
-        # Calculate expiration
-        expires_at = datetime.utcnow() + timedelta(days=SESSION_EXPIRE_DAYS)
-
-        # Store session in database
-        session_id = await pool.fetchval(
+        # Store session in database (expiry computed by the database clock)
+        await pool.execute(
             """INSERT INTO user_sessions (user_id, token_hash, expires_at)
-               VALUES ($1, $2, $3) RETURNING id""",
-            row["id"], token_hash, expires_at
+               VALUES ($1, $2, NOW() + make_interval(days => $3))""",
+            row["id"], token_hash, SESSION_EXPIRE_DAYS
         )
 
         # Set HTTP-only cookie
@@ -224,11 +157,13 @@ async def logout(
         if session_token:
             token_hash = hashlib_sha256(session_token)
 
-            # Delete session from database
+            # Delete session from database, then evict it so no lookup
+            # running alongside the DELETE can cache it again
             await pool.execute(
                 "DELETE FROM user_sessions WHERE token_hash = $1",
                 token_hash
             )
+            invalidate_session(token_hash)
 
             logger.info(f"User logged out (token deleted)")
 
@@ -297,26 +232,11 @@ async def verify_token(
             return TokenResponse(valid=False, user=None)
 
         token_hash = hashlib_sha256(session_token)
+        user = await lookup_session_user(pool, token_hash)
 
-        # Look up session
-        row = await pool.fetchrow(
-            """SELECT us.expires_at, u.id, u.username, u.created_at, u.updated_at
-               FROM user_sessions us
-               JOIN users u ON us.user_id = u.id
-               WHERE us.token_hash = $1 AND us.expires_at > NOW()""",
-            token_hash
-        )
-
-        if not row:
+        if not user:
             return TokenResponse(valid=False, user=None)
 
-        user = User(
-            id=str(row["id"]),
-            username=row["username"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
-
         return TokenResponse(valid=True, user=user)
 
     except Exception as e:
@@ -328,15 +248,117 @@ async def verify_token(
 # USER SETTINGS
 # ============================================================================
 
+USER_SETTINGS_COLUMNS = """id, user_id, llm_api_key, llm_model, llm_base_url, llm_provider,
+    embedding_api_key, embedding_model, embedding_base_url, embedding_provider,
+    embedding_dimension, audio_model, http_proxy_host, http_proxy_port,
+    http_proxy_username, http_proxy_password, search_preferences, created_at, updated_at"""
+
+# Returns the user's settings, creating the default row on first access, in
+# one statement. Exactly one branch yields a row: the SELECT runs on the
+# statement snapshot, which does not include the row the CTE inserts.
+GET_OR_CREATE_SETTINGS_SQL = f"""
+    WITH created AS (
+        INSERT INTO user_settings (user_id) VALUES ($1)
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING {USER_SETTINGS_COLUMNS}
+    )
+    SELECT {USER_SETTINGS_COLUMNS} FROM created
+    UNION ALL
+    SELECT {USER_SETTINGS_COLUMNS} FROM user_settings WHERE user_id = $1
+"""
+
+
+@lru_cache(maxsize=256)
+def _build_settings_update_sql(fields: Tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for a set of settings fields.
+
+    Cached per field set, so repeated updates reuse identical SQL text and
+    hit asyncpg's prepared statement cache.
+
+    Args:
+        fields: Sorted names of the fields being updated
+
+    Returns:
+        SQL taking the field values in order, then the user ID
+    """
+    unknown = set(fields) - UserSettingsUpdate.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown settings fields: {sorted(unknown)}")
+
+    assignments = ", ".join(f"{field} = ${i}" for i, field in enumerate(fields, start=1))
+    return f"""UPDATE user_settings SET {assignments}, updated_at = NOW()
+               WHERE user_id = ${len(fields) + 1}
+               RETURNING {USER_SETTINGS_COLUMNS}"""
+
+
+async def _fetch_settings_row(pool: asyncpg.Pool, user_id: str) -> asyncpg.Record:
+    """Fetch the user's settings row, creating the defaults on first access."""
+    row = await pool.fetchrow(GET_OR_CREATE_SETTINGS_SQL, user_id)
+
+    if row is None:
+        # A concurrent first access inserted the row after our snapshot
+        row = await pool.fetchrow(
+            f"SELECT {USER_SETTINGS_COLUMNS} FROM user_settings WHERE user_id = $1",
+            user_id
+        )
+
+    return row
+
+
+def _row_to_user_settings(row: asyncpg.Record) -> UserSettings:
+    """
+    Build the settings response from a user_settings row.
+
+    The row comes straight from our own table, so the model is constructed
+    without re-running validation.
+
+    Args:
+        row: Row selected with USER_SETTINGS_COLUMNS
+
+    Returns:
+        User settings with API keys and proxy password masked
+    """
+    return UserSettings.model_construct(
+        id=str(row["id"]),
+        user_id=str(row["user_id"]),
+        llm_api_key=mask_api_key(row["llm_api_key"]),
+        llm_model=row["llm_model"],
+        llm_base_url=row["llm_base_url"],
+        llm_provider=row["llm_provider"],
+        embedding_api_key=mask_api_key(row["embedding_api_key"]),
+        embedding_model=row["embedding_model"],
+        embedding_base_url=row["embedding_base_url"],
+        embedding_provider=row["embedding_provider"],
+        embedding_dimension=row["embedding_dimension"],
+        audio_model=row["audio_model"],
+        http_proxy_host=row["http_proxy_host"],
+        http_proxy_port=row["http_proxy_port"],
+        http_proxy_username=row["http_proxy_username"],
+        http_proxy_password=mask_api_key(row["http_proxy_password"]),
+        # JSONB arrives decoded (pool codec)
+        search_preferences=row["search_preferences"] or {},
+        created_at=row["created_at"],
+        updated_at=row["updated_at"]
+    )
+
+
 @router.get("/settings", response_model=UserSettings)
 async def get_user_settings(
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user_dep),
     pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> UserSettings:
     """
     Get current user's settings.
 
+    Answers 304 Not Modified when the client's If-None-Match matches the
+    settings version (updated_at).
+
     Args:
+        request: Incoming request
+        response: Response (for ETag headers)
         user: Current user from dependency
         pool: Database connection pool
 
@@ -347,60 +369,16 @@ async def get_user_settings(
         HTTPException: If settings not found
     """
     try:
-        row = await pool.fetchrow(
-            """SELECT id, user_id, llm_api_key, llm_model, llm_base_url, llm_provider,
-                      embedding_api_key, embedding_model, embedding_base_url, embedding_provider,
-                      embedding_dimension, audio_model, http_proxy_host, http_proxy_port,
-                      http_proxy_username, http_proxy_password, search_preferences, created_at, updated_at
-               FROM user_settings WHERE user_id = $1""",
-            user.id
-        )
+        row = await _fetch_settings_row(pool, user.id)
 
-        if not row:
-            # Create default settings for user
-            row = await pool.fetchrow(
-                """INSERT INTO user_settings (user_id)
-                   VALUES ($1) RETURNING *""",
-                user.id
-            )
+        # Version check on the row already fetched; skip serializing on a match
+        etag = make_etag(user.id, row["updated_at"])
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
 
-        # Mask API keys and proxy password in response
-        llm_api_key = mask_api_key(row["llm_api_key"])
-        embedding_api_key = mask_api_key(row["embedding_api_key"])
-        proxy_password = mask_api_key(row["http_proxy_password"])
-
-        # Parse search_preferences from JSONB (can be dict, str, or None)
-        search_prefs = row["search_preferences"]
-        if isinstance(search_prefs, str):
-            import json
-            try:
-                search_prefs = json.loads(search_prefs)
-            except:
-                search_prefs = {}
-        elif search_prefs is None:
-            search_prefs = {}
-
-        return UserSettings(
-            id=str(row["id"]),
-            user_id=str(row["user_id"]),
-            llm_api_key=llm_api_key,
-            llm_model=row["llm_model"],
-            llm_base_url=row["llm_base_url"],
-            llm_provider=row["llm_provider"],
-            embedding_api_key=embedding_api_key,
-            embedding_model=row["embedding_model"],
-            embedding_base_url=row["embedding_base_url"],
-            embedding_provider=row["embedding_provider"],
-            embedding_dimension=row["embedding_dimension"],
-            audio_model=row["audio_model"],
-            http_proxy_host=row["http_proxy_host"],
-            http_proxy_port=row["http_proxy_port"],
-            http_proxy_username=row["http_proxy_username"],
-            http_proxy_password=proxy_password,
-            search_preferences=search_prefs,
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
+        response.headers.update(etag_headers(etag))
+        return _row_to_user_settings(row)
 
     except Exception as e:
         logger.exception(f"Error getting user settings: {e}")
@@ -431,25 +409,18 @@ async def update_user_settings(
         HTTPException: If update fails
     """
     try:
-        # Build update query
-        updates = []
-        params = []
-        param_count = 1
-
-        for field, value in settings_update.model_dump(exclude_unset=True).items():
-            updates.append(f"{field} = ${param_count}")
-            params.append(value)
-            param_count += 1
-
-        if not updates:
-            return await get_user_settings(user, pool)
-
-        params.append(user.id)
-        query = f"""UPDATE user_settings SET {', '.join(updates)}, updated_at = NOW()
-                   WHERE user_id = ${param_count}
-                   RETURNING *"""
+        updates = settings_update.model_dump(exclude_unset=True)
 
-        row = await pool.fetchrow(query, *params)
+        if updates:
+            fields = tuple(sorted(updates))
+            row = await pool.fetchrow(
+                _build_settings_update_sql(fields),
+                *(updates[field] for field in fields),
+                user.id
+            )
+        else:
+            # Nothing to change: return current settings
+            row = await _fetch_settings_row(pool, user.id)
 
         if not row:
             raise HTTPException(
@@ -457,43 +428,7 @@ async def update_user_settings(
                 detail="Settings not found"
             )
 
-        # Mask API keys and proxy password in response
-        llm_api_key = mask_api_key(row["llm_api_key"])
-        embedding_api_key = mask_api_key(row["embedding_api_key"])
-        proxy_password = mask_api_key(row["http_proxy_password"])
-
-        # Parse search_preferences from JSONB (can be dict, str, or None)
-        search_prefs = row["search_preferences"]
-        if isinstance(search_prefs, str):
-            import json
-            try:
-                search_prefs = json.loads(search_prefs)
-            except:
-                search_prefs = {}
-        elif search_prefs is None:
-            search_prefs = {}
-
-        return UserSettings(
-            id=str(row["id"]),
-            user_id=str(row["user_id"]),
-            llm_api_key=llm_api_key,
-            llm_model=row["llm_model"],
-            llm_base_url=row["llm_base_url"],
-            llm_provider=row["llm_provider"],
-            embedding_api_key=embedding_api_key,
-            embedding_model=row["embedding_model"],
-            embedding_base_url=row["embedding_base_url"],
-            embedding_provider=row["embedding_provider"],
-            embedding_dimension=row["embedding_dimension"],
-            audio_model=row["audio_model"],
-            http_proxy_host=row["http_proxy_host"],
-            http_proxy_port=row["http_proxy_port"],
-            http_proxy_username=row["http_proxy_username"],
-            http_proxy_password=proxy_password,
-            search_preferences=search_prefs,
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
+        return _row_to_user_settings(row)
 
     except HTTPException:
         raise
@@ -505,79 +440,10 @@ async def update_user_settings(
         )
 
 
-# ============================================================================
-# DEPENDENCY: GET CURRENT USER
-# ============================================================================
-
-async def get_current_user_dep(
-    request: Request,
-    pool: asyncpg.Pool = Depends(get_db_pool)
-) -> User:
-    """
-    Dependency to get current authenticated user from session cookie.
-
-    Args:
-        request: FastAPI request
-        pool: Database connection pool
-
-    Returns:
-        Current user
-
-    Raises:
-        HTTPException: If not authenticated
-    """
-    # Get session token from cookie
-    session_token = request.cookies.get("session_token")
-
-    if not session_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-
-    token_hash = hashlib_sha256(session_token)
-
-    # Look up session with user
-    row = await pool.fetchrow(
-        """SELECT u.id, u.username, u.created_at, u.updated_at
-           FROM user_sessions us
-           JOIN users u ON us.user_id = u.id
-           WHERE us.token_hash = $1 AND us.expires_at > NOW()""",
-        token_hash
-    )
-
-    if not row:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired session"
-        )
-
-    return User(
-        id=str(row["id"]),
-        username=row["username"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"]
-    )
-
-
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def hashlib_sha256(data: str) -> str:
-    """
-    Calculate SHA256 hash of string.
-
-    Args:
-        data: String to hash
-
-    Returns:
-        Hexadecimal hash string
-    """
-    import hashlib
-    return hashlib.sha256(data.encode()).hexdigest()
-
-
 def mask_api_key(api_key: Optional[str]) -> Optional[str]:
     """
     Mask API key for display (show first 8 and last 4 characters).
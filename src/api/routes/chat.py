@@ -2,22 +2,103 @@
 
 import logging
 import json
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
-from pydantic_ai.messages import ModelMessage
+from pydantic import TypeAdapter
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
 
-from src.api.models.requests import ChatRequest
+from src.api.models.requests import ChatMessage, ChatRequest
 from src.api.models.responses import ChatChunkEvent
 from src.api.models.auth import User
-from src.api.dependencies import get_agent_dependencies, get_db_pool, get_current_user
+from src.api.dependencies import get_agent_dependencies, get_db_pool, get_current_user, get_settings
 from src.agent import rag_agent
+from src.dependencies import AgentDependencies
+from src.providers import get_llm_model
+from src.settings import Settings
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
+# Serializes chat events straight to JSON bytes (pydantic-core, no str round trip)
+_chat_event_adapter = TypeAdapter(ChatChunkEvent)
+
+
+def _encode_sse(event: ChatChunkEvent) -> bytes:
+    """
+    Frame a chat event as a Server-Sent Events message.
+
+    Args:
+        event: Chat event to send
+
+    Returns:
+        Encoded SSE message
+    """
+    return b"event: %s\ndata: %s\n\n" % (event.event.encode(), _chat_event_adapter.dump_json(event))
+
+
+def _to_model_messages(history: List[ChatMessage]) -> List[ModelMessage]:
+    """
+    Convert client chat history to pydantic_ai messages.
+
+    The agent only understands ModelRequest/ModelResponse objects, so the
+    history is built directly in that form rather than as role/content dicts.
+
+    Args:
+        history: Chat history from the request
+
+    Returns:
+        Message history for rag_agent.run
+    """
+    return [
+        ModelRequest(parts=[UserPromptPart(content=msg.content)])
+        if msg.role == "user"
+        else ModelResponse(parts=[TextPart(content=msg.content)])
+        for msg in history
+    ]
+
+
+async def _start_chat_turn(
+    pool: asyncpg.Pool,
+    session_id: str,
+    message: str,
+    user_id: str
+) -> Tuple[Any, Optional[asyncpg.Record]]:
+    """
+    Save the user message and load the user's model settings.
+
+    Both statements run on a single pooled connection; the connection is
+    released before the agent runs so it is not held for the LLM call.
+
+    Args:
+        pool: Database connection pool
+        session_id: Session UUID
+        message: User message content
+        user_id: User UUID
+
+    Returns:
+        Tuple of (user message ID, user settings row or None)
+    """
+    async with pool.acquire() as conn:
+        user_message_id = await conn.fetchval(
+            """INSERT INTO chat_messages (session_id, role, content, metadata)
+               VALUES ($1, 'user', $2, '{}'::jsonb) RETURNING id""",
+            session_id,
+            message
+        )
+
+        user_settings_row = await conn.fetchrow(
+            """SELECT llm_api_key, llm_model, llm_base_url, llm_provider,
+                      embedding_api_key, embedding_model, embedding_base_url,
+                      http_proxy_host, http_proxy_port, http_proxy_username, http_proxy_password
+               FROM user_settings WHERE user_id = $1""",
+            user_id
+        )
+
+    return user_message_id, user_settings_row
+
 
 # ============================================================================
 # STREAM CHAT ENDPOINT
@@ -27,7 +108,8 @@ router = APIRouter(prefix="/api", tags=["chat"])
 async def stream_chat(
     request_data: ChatRequest,
     pool: asyncpg.Pool = Depends(get_db_pool),
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ) -> StreamingResponse:
     """
     Stream chat response using Server-Sent Events.
@@ -35,6 +117,8 @@ async def stream_chat(
     Args:
         request_data: Chat request with session, project, message, and history
         pool: Database connection pool
+        user: Current authenticated user
+        settings: Application settings
 
     Returns:
         StreamingResponse with SSE events
@@ -43,44 +127,25 @@ async def stream_chat(
         HTTPException: If request fails
     """
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE events for chat streaming."""
         user_message_id = None
         assistant_message_id = None
 
         try:
-            # 1. Save user message
-            user_message_id = await pool.fetchval(
-                """INSERT INTO chat_messages (session_id, role, content, metadata)
-                   VALUES ($1, 'user', $2, '{}'::jsonb) RETURNING id""",
-                request_data.session_id,
-                request_data.message
+            # 1. Save user message and load user-specific settings
+            user_message_id, user_settings_row = await _start_chat_turn(
+                pool, request_data.session_id, request_data.message, user.id
             )
 
             # 2. Send start event
-            event = ChatChunkEvent(event="start", session_id=request_data.session_id)
-            yield f"event: start\ndata: {event.model_dump_json()}\n\n"
+            yield _encode_sse(ChatChunkEvent(event="start", session_id=request_data.session_id))
 
             # 3. Run agent and stream response
             agent_deps = None
             try:
-                # Get dependencies
-                from src.dependencies import AgentDependencies
-                from src.api.dependencies import get_settings
-
-                # Load global settings
-                settings = await get_settings()
-
-                # Load user-specific settings from database
-                user_settings_row = await pool.fetchrow(
-                    """SELECT llm_api_key, llm_model, llm_base_url, llm_provider,
-                              embedding_api_key, embedding_model, embedding_base_url,
-                              http_proxy_host, http_proxy_port, http_proxy_username, http_proxy_password
-                       FROM user_settings WHERE user_id = $1""",
-                    user.id
-                )
-
                 agent_deps = AgentDependencies(
+                    db_pool=pool,
                     project_id=request_data.project_id,
                     session_id=request_data.session_id,
                     settings=settings,
@@ -89,13 +154,9 @@ async def stream_chat(
                 await agent_deps.initialize()
 
                 # Build message history
-                message_history = [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in request_data.message_history
-                ]
+                message_history = _to_model_messages(request_data.message_history)
 
                 # Create model with user settings (including proxy)
-                from src.providers import get_llm_model
                 user_model = get_llm_model(user_settings=user_settings_row)
 
                 # Run agent with user-specific model (non-streaming for now)
@@ -111,8 +172,7 @@ async def stream_chat(
                 # Send chunk events
                 # For now, send full response as one chunk
                 # TODO: Upgrade to true streaming when pydantic_ai supports it
-                chunk_event = ChatChunkEvent(event="chunk", content=response_text)
-                yield f"event: chunk\ndata: {chunk_event.model_dump_json()}\n\n"
+                yield _encode_sse(ChatChunkEvent(event="chunk", content=response_text))
 
                 # 4. Save assistant message
                 assistant_message_id = await pool.fetchval(
@@ -129,7 +189,7 @@ async def stream_chat(
                     session_id=request_data.session_id,
                     message_id=str(assistant_message_id)
                 )
-                yield f"event: done\ndata: {done_event.model_dump_json()}\n\n"
+                yield _encode_sse(done_event)
 
             finally:
                 # Clean up agent dependencies
@@ -138,8 +198,7 @@ async def stream_chat(
 
         except Exception as e:
             logger.exception(f"Error in chat streaming: {e}")
-            error_event = ChatChunkEvent(event="error", content=str(e))
-            yield f"event: error\ndata: {error_event.model_dump_json()}\n\n"
+            yield _encode_sse(ChatChunkEvent(event="error", content=str(e)))
 
     return StreamingResponse(
         event_generator(),
@@ -160,7 +219,8 @@ async def stream_chat(
 async def chat(
     request_data: ChatRequest,
     pool: asyncpg.Pool = Depends(get_db_pool),
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ) -> dict:
     """
     Non-streaming chat endpoint (fallback for clients that don't support SSE).
@@ -168,36 +228,21 @@ async def chat(
     Args:
         request_data: Chat request with session, project, message, and history
         pool: Database connection pool
+        user: Current authenticated user
+        settings: Application settings
 
     Returns:
         Dictionary with response content
     """
     try:
-        # Save user message
-        await pool.fetchval(
-            """INSERT INTO chat_messages (session_id, role, content, metadata)
-               VALUES ($1, 'user', $2, '{}'::jsonb) RETURNING id""",
-            request_data.session_id,
-            request_data.message
+        # Save user message and load user-specific settings
+        _, user_settings_row = await _start_chat_turn(
+            pool, request_data.session_id, request_data.message, user.id
         )
 
         # Run agent
-        from src.dependencies import AgentDependencies
-        from src.api.dependencies import get_settings
-
-        # Load global settings
-        settings = await get_settings()
-
-        # Load user-specific settings from database
-        user_settings_row = await pool.fetchrow(
-            """SELECT llm_api_key, llm_model, llm_base_url, llm_provider,
-                      embedding_api_key, embedding_model, embedding_base_url,
-                      http_proxy_host, http_proxy_port, http_proxy_username, http_proxy_password
-               FROM user_settings WHERE user_id = $1""",
-            user.id
-        )
-
         agent_deps = AgentDependencies(
+            db_pool=pool,
             project_id=request_data.project_id,
             session_id=request_data.session_id,
             settings=settings,
@@ -207,13 +252,9 @@ async def chat(
 
         try:
             # Build message history
-            message_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in request_data.message_history
-            ]
+            message_history = _to_model_messages(request_data.message_history)
 
             # Create model with user settings (including proxy)
-            from src.providers import get_llm_model
             user_model = get_llm_model(user_settings=user_settings_row)
 
             result = await rag_agent.run(
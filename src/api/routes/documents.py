@@ -1,20 +1,26 @@
 """Document management routes with file upload support."""
 
-import json
 import logging
 import os
+import shutil
 import tempfile
 import hashlib
 import asyncio
-from typing import List, Dict, Any
+import uuid
+from uuid import UUID
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
+import aiofiles
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks, Request, Response
 
 from src.api.models.responses import Document, UploadResult
 from src.api.models.jobs import JobStatus
-from src.api.dependencies import get_db_pool, get_current_user
+from src.api.dependencies import get_db_pool, get_current_user, get_settings
+from src.api.utils import make_etag, not_modified, etag_headers, parse_metadata, update_ingestion_job
 from src.api.models.auth import User
-from src.settings import Settings, load_settings
+from src.dependencies import calculate_file_hash
+from src.ingestion.ingest import DocumentIngestionPipeline, IngestionConfig
+from src.settings import Settings
 from src.api.models.requests import ProjectCreate
 import asyncpg
 
@@ -22,80 +28,129 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["documents"])
 
+# Uploads are copied to disk in 1 MiB chunks so memory stays bounded
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Maximum number of files from one upload request processed at the same time
+UPLOAD_CONCURRENCY = 4
+
+DUPLICATE_FILE_ERROR = "Файл с таким содержимым уже существует в проекте"
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def parse_metadata(metadata: Any) -> Dict[str, Any]:
+def upload_staging_dir(settings: Settings, files: List[UploadFile]) -> Optional[str]:
     """
-    Safely parse metadata from database to dict.
+    Pick the directory to stage an upload batch in.
+
+    Uses the configured upload_tmp_dir (typically a tmpfs) when it has room
+    for the whole batch, otherwise the system temp directory.
 
     Args:
-        metadata: Metadata from database (can be dict, str, or None)
+        settings: Application settings
+        files: Files in the upload batch
 
     Returns:
-        Dict with metadata
+        Directory path, or None for the system default
     """
-    if metadata is None:
-        return {}
-    if isinstance(metadata, dict):
-        return metadata
-    if isinstance(metadata, str):
-        try:
-            return json.loads(metadata)
-        except json.JSONDecodeError:
-            return {}
-    return {}
+    staging_dir = settings.upload_tmp_dir
+    if not staging_dir or not os.path.isdir(staging_dir):
+        return None
 
+    batch_size = sum(file.size or 0 for file in files)
+    if shutil.disk_usage(staging_dir).free < batch_size:
+        logger.info(f"Upload batch ({batch_size} bytes) does not fit in {staging_dir}, using disk")
+        return None
 
-def calculate_file_hash(file_path: str) -> str:
+    return staging_dir
+
+
+def upload_staging_path(temp_dir: str, index: int, filename: str) -> str:
     """
-    Calculate SHA256 hash of a file.
+    Path to stage one file of an upload batch at.
+
+    Every file gets its own subdirectory, so files with the same name in one
+    batch do not overwrite each other while they are being processed.
 
     Args:
-        file_path: Path to file
+        temp_dir: Temporary directory for the upload batch
+        index: Position of the file in the batch
+        filename: Original filename
 
     Returns:
-        Hexadecimal hash string
+        Destination path (parent directory is created)
+    """
+    file_dir = os.path.join(temp_dir, str(index))
+    os.makedirs(file_dir, exist_ok=True)
+    return os.path.join(file_dir, filename)
+
+
+def remove_staged_upload(file_path: str) -> None:
+    """
+    Remove a staged upload together with its per-file directory.
+
+    The batch directory is removed as well once the last file in it is gone.
+
+    Args:
+        file_path: Path returned by upload_staging_path
+    """
+    file_dir = os.path.dirname(file_path)
+    shutil.rmtree(file_dir, ignore_errors=True)
+    try:
+        os.rmdir(os.path.dirname(file_dir))
+    except OSError:
+        pass
+
+
+async def save_upload_file(file: UploadFile, dest_path: str) -> str:
+    """
+    Stream an uploaded file to disk without loading it fully into memory.
+
+    The SHA256 hash is computed in the same pass, so the file does not
+    have to be read back from disk for deduplication.
+
+    Args:
+        file: Uploaded file
+        dest_path: Destination path on disk
+
+    Returns:
+        Hexadecimal SHA256 hash of the file content
     """
     sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+    async with aiofiles.open(dest_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
             sha256_hash.update(chunk)
+            await f.write(chunk)
     return sha256_hash.hexdigest()
 
 
 async def process_file_background(
+    pool: asyncpg.Pool,
     job_id: str,
     file_path: str,
     filename: str,
     project_id: str,
-    user_id: str
+    user_id: str,
+    file_hash: Optional[str] = None
 ) -> None:
     """
     Background task to process uploaded file.
 
     Args:
+        pool: Shared application database pool
         job_id: Job UUID
         file_path: Path to uploaded file
         filename: Original filename
         project_id: Project UUID
         user_id: User UUID
+        file_hash: SHA256 of the file if already computed during upload
     """
-    settings = load_settings()
-    pool = None
-
     try:
-        # Connect to database
-        pool = await asyncpg.create_pool(settings.database_url, min_size=1, max_size=2)
-
         # Update job status to processing
-        await pool.execute(
-            """UPDATE ingestion_jobs
-               SET status = 'processing', started_at = NOW(), progress = 10
-               WHERE id = $1""",
-            job_id
+        await update_ingestion_job(
+            pool, job_id, "status = 'processing', started_at = NOW(), progress = 10"
         )
 
         # Load user settings
@@ -108,7 +163,8 @@ async def process_file_background(
         )
 
         # Check if file already exists
-        file_hash = calculate_file_hash(file_path)
+        if file_hash is None:
+            file_hash = await asyncio.to_thread(calculate_file_hash, file_path)
         existing = await pool.fetchrow(
             """SELECT id FROM documents
                WHERE source = $1 AND file_hash = $2 AND project_id = $3""",
@@ -117,25 +173,14 @@ async def process_file_background(
 
         if existing:
             logger.warning(f"File {filename} already exists (duplicate)")
-            await pool.execute(
-                """UPDATE ingestion_jobs
-                   SET status = 'failed',
-                       progress = 100,
-                       error_message = 'Файл с таким содержимым уже существует в проекте',
-                       completed_at = NOW()
-                   WHERE id = $1""",
-                job_id
+            await update_ingestion_job(
+                pool, job_id,
+                "status = 'failed', progress = 100, error_message = $2, completed_at = NOW()",
+                DUPLICATE_FILE_ERROR
             )
-            os.remove(file_path)
             return
 
         # Process document
-        await pool.execute(
-            """UPDATE ingestion_jobs SET progress = 30 WHERE id = $1""", job_id
-        )
-
-        from src.ingestion.ingest import DocumentIngestionPipeline, IngestionConfig
-
         config = IngestionConfig(project_id=project_id, incremental=True)
         temp_dir = os.path.dirname(file_path)
 
@@ -144,56 +189,42 @@ async def process_file_background(
             documents_folder=temp_dir,
             clean_before_ingest=False,
             project_id=project_id,
-            user_settings=user_settings_row
+            user_settings=user_settings_row,
+            db_pool=pool
         )
         await pipeline.initialize()
 
-        await pool.execute(
-            """UPDATE ingestion_jobs SET progress = 50 WHERE id = $1""", job_id
-        )
-
         # Ingest file
-        doc_result = await pipeline._ingest_single_document(file_path)
-        await pipeline.close()
+        try:
+            doc_result = await pipeline._ingest_single_document(file_path)
+        finally:
+            await pipeline.close()
 
         if doc_result.errors:
             # Failed
-            await pool.execute(
-                """UPDATE ingestion_jobs
-                   SET status = 'failed', error_message = $2, completed_at = NOW(), progress = 0
-                   WHERE id = $1""",
-                job_id, doc_result.errors[0]
+            await update_ingestion_job(
+                pool, job_id,
+                "status = 'failed', error_message = $2, completed_at = NOW(), progress = 0",
+                doc_result.errors[0]
             )
         else:
             # Success
-            await pool.execute(
-                """UPDATE ingestion_jobs
-                   SET status = 'completed', chunks_created = $2, completed_at = NOW(), progress = 100
-                   WHERE id = $1""",
-                job_id, doc_result.chunks_created
+            await update_ingestion_job(
+                pool, job_id,
+                "status = 'completed', chunks_created = $2, completed_at = NOW(), progress = 100",
+                doc_result.chunks_created
             )
 
-        # Clean up file
-        os.remove(file_path)
-
     except Exception as e:
         logger.exception(f"Background processing failed for job {job_id}: {e}")
-        if pool:
-            await pool.execute(
-                """UPDATE ingestion_jobs
-                   SET status = 'failed', error_message = $2, completed_at = NOW()
-                   WHERE id = $1""",
-                job_id, str(e)
-            )
-        # Clean up file on error
-        try:
-            os.remove(file_path)
-        except:
-            pass
+        await update_ingestion_job(
+            pool, job_id,
+            "status = 'failed', error_message = $2, completed_at = NOW()",
+            str(e)
+        )
 
     finally:
-        if pool:
-            await pool.close()
+        remove_staged_upload(file_path)
 
 
 # ============================================================================
@@ -202,7 +233,9 @@ async def process_file_background(
 
 @router.get("/projects/{project_id}/documents", response_model=List[Document])
 async def get_project_documents(
-    project_id: str,
+    request: Request,
+    response: Response,
+    project_id: UUID,
     limit: int = 100,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
@@ -210,7 +243,12 @@ async def get_project_documents(
     """
     Get all documents for a project (verifies user owns the project).
 
+    Answers 304 Not Modified when the project's document set is unchanged
+    since the version named in If-None-Match.
+
     Args:
+        request: Incoming request
+        response: Response (for ETag headers)
         project_id: Project UUID
         limit: Maximum documents to return
         pool: Database connection pool
@@ -223,21 +261,29 @@ async def get_project_documents(
         HTTPException: If user doesn't own the project
     """
     try:
-        # Verify user owns the project
-        project_exists = await pool.fetchval(
-            "SELECT id FROM projects WHERE id = $1 AND user_id = $2",
+        # Verify user owns the project and get the document set version:
+        # update_project_timestamp bumps updated_at on every document insert
+        # or update, and update_project_count changes doc_count on every
+        # delete, so the pair changes whenever the list can
+        version = await pool.fetchrow(
+            "SELECT doc_count, updated_at FROM projects WHERE id = $1 AND user_id = $2",
             project_id, user.id
         )
-        if not project_exists:
+        if not version:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project {project_id} not found"
             )
 
+        etag = make_etag(project_id, limit, version["doc_count"], version["updated_at"])
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        response.headers.update(etag_headers(etag))
+
         rows = await pool.fetch(
             """SELECT d.id, d.title, d.source, d.uri, d.metadata, d.project_id,
-                      d.first_ingested, d.last_ingested, d.ingestion_count,
-                      (SELECT COUNT(*) FROM chunks WHERE document_id = d.id) as chunk_count
+                      d.first_ingested, d.last_ingested, d.ingestion_count, d.chunk_count
                FROM documents d
                WHERE d.project_id = $1
                ORDER BY d.last_ingested DESC
@@ -261,6 +307,8 @@ async def get_project_documents(
             for row in rows
         ]
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Error getting documents: {e}")
         raise HTTPException(
@@ -275,14 +323,21 @@ async def get_project_documents(
 
 @router.get("/documents/{document_id}", response_model=Document)
 async def get_document(
-    document_id: str,
+    request: Request,
+    response: Response,
+    document_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> Document:
     """
     Get document details by ID (verifies user owns the project).
 
+    Answers 304 Not Modified when the document has not been re-ingested
+    since the version named in If-None-Match.
+
     Args:
+        request: Incoming request
+        response: Response (for ETag headers)
         document_id: Document UUID
         pool: Database connection pool
         user: Current authenticated user
@@ -294,10 +349,11 @@ async def get_document(
         HTTPException: If document not found or user doesn't own the project
     """
     try:
+        # The row is a cheap single-row fetch, so read it once and derive
+        # the ETag from it for both the 304 and the full response
         row = await pool.fetchrow(
             """SELECT d.id, d.title, d.source, d.uri, d.metadata, d.project_id,
-                      d.first_ingested, d.last_ingested, d.ingestion_count,
-                      (SELECT COUNT(*) FROM chunks WHERE document_id = d.id) as chunk_count
+                      d.first_ingested, d.last_ingested, d.ingestion_count, d.chunk_count
                FROM documents d
                JOIN projects p ON d.project_id = p.id
                WHERE d.id = $1 AND p.user_id = $2""",
@@ -310,6 +366,12 @@ async def get_document(
                 detail=f"Document {document_id} not found"
             )
 
+        etag = make_etag(document_id, row["last_ingested"], row["ingestion_count"])
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        response.headers.update(etag_headers(etag))
+
         return Document(
             id=str(row["id"]),
             title=row["title"],
@@ -339,7 +401,7 @@ async def get_document(
 
 @router.delete("/documents/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
-    document_id: str,
+    document_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> None:
@@ -355,13 +417,15 @@ async def delete_document(
         HTTPException: If deletion fails or user doesn't own the project
     """
     try:
-        result = await pool.execute(
+        # Chunks, entities and relations go with it via ON DELETE CASCADE
+        deleted_id = await pool.fetchval(
             """DELETE FROM documents
-               WHERE id = $1 AND project_id IN (SELECT id FROM projects WHERE user_id = $2)""",
+               WHERE id = $1 AND project_id IN (SELECT id FROM projects WHERE user_id = $2)
+               RETURNING id""",
             document_id, user.id
         )
 
-        if "DELETE 1" not in result:
+        if deleted_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Document {document_id} not found"
@@ -383,12 +447,101 @@ async def delete_document(
 # UPLOAD FILES
 # ============================================================================
 
+async def _process_upload(
+    file: UploadFile,
+    index: int,
+    temp_dir: str,
+    project_id: str,
+    pool: asyncpg.Pool,
+    pipeline: DocumentIngestionPipeline,
+    semaphore: asyncio.Semaphore,
+    batch_keys: Set[Tuple[str, str]]
+) -> UploadResult:
+    """
+    Save, deduplicate and ingest a single uploaded file.
+
+    Args:
+        file: Uploaded file
+        index: Position of the file in the batch
+        temp_dir: Temporary directory for the upload batch
+        project_id: Project UUID
+        pool: Database connection pool
+        pipeline: Initialized ingestion pipeline shared by the batch
+        semaphore: Limits how many files are processed at once
+        batch_keys: (filename, hash) pairs already claimed by this batch
+
+    Returns:
+        Upload result for the file
+    """
+    async with semaphore:
+        try:
+            logger.info(f"Processing file: {file.filename} ({file.size})")
+
+            # Save to temp file
+            temp_path = upload_staging_path(temp_dir, index, file.filename)
+            file_hash = await save_upload_file(file, temp_path)
+
+            # Same file uploaded twice in this batch: ingest it only once
+            key = (file.filename, file_hash)
+            if key in batch_keys:
+                logger.info(f"File {file.filename} is duplicated in the batch, skipping")
+                return UploadResult(
+                    filename=file.filename,
+                    success=True,
+                    chunks=0,
+                    status="skipped (duplicate in batch)"
+                )
+            batch_keys.add(key)
+
+            # Check if already exists
+            existing = await pool.fetchrow(
+                """SELECT id, title, ingestion_count
+                   FROM documents
+                   WHERE source = $1 AND file_hash = $2 AND project_id = $3""",
+                file.filename, file_hash, project_id
+            )
+
+            if existing:
+                logger.info(f"File {file.filename} already exists, skipping")
+                # Update ingestion metadata
+                await pool.execute(
+                    "UPDATE documents SET last_ingested = NOW(), ingestion_count = ingestion_count + 1 WHERE id = $1",
+                    existing["id"]
+                )
+                return UploadResult(
+                    filename=file.filename,
+                    success=True,
+                    chunks=0,
+                    status="skipped (already exists)"
+                )
+
+            # Ingest single file
+            doc_result = await pipeline._ingest_single_document(temp_path, source=file.filename)
+
+            return UploadResult(
+                filename=file.filename,
+                success=len(doc_result.errors) == 0,
+                chunks=doc_result.chunks_created,
+                status="processed",
+                error=doc_result.errors[0] if doc_result.errors else None
+            )
+
+        except Exception as e:
+            logger.exception(f"Failed to process {file.filename}: {e}")
+            return UploadResult(
+                filename=file.filename,
+                success=False,
+                error=str(e)
+            )
+
+
 @router.post("/projects/{project_id}/upload", response_model=List[UploadResult])
 async def upload_files(
-    project_id: str,
+    project_id: UUID,
     files: List[UploadFile] = File(...),
     pool: asyncpg.Pool = Depends(get_db_pool),
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ) -> List[UploadResult]:
     """
     Upload and process files for a project (verifies user owns the project).
@@ -398,6 +551,7 @@ async def upload_files(
         files: List of files to upload
         pool: Database connection pool
         user: Current authenticated user
+        settings: Application settings
 
     Returns:
         List of upload results
@@ -406,121 +560,67 @@ async def upload_files(
         HTTPException: If upload fails or user doesn't own the project
     """
     results = []
-    temp_dir = tempfile.mkdtemp()
+    pipeline = None
 
-    try:
-        # Verify user owns the project
-        project_exists = await pool.fetchval(
-            "SELECT id FROM projects WHERE id = $1 AND user_id = $2",
-            project_id, user.id
-        )
-        if not project_exists:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project {project_id} not found"
+    # The whole batch directory is removed on exit, including on errors
+    with tempfile.TemporaryDirectory(dir=upload_staging_dir(settings, files)) as temp_dir:
+        try:
+            # Verify user owns the project
+            project_exists = await pool.fetchval(
+                "SELECT id FROM projects WHERE id = $1 AND user_id = $2",
+                project_id, user.id
             )
-
-        for file in files:
-            try:
-                logger.info(f"Processing file: {file.filename} ({file.size})")
-
-                # Save to temp file
-                temp_path = os.path.join(temp_dir, file.filename)
-                with open(temp_path, "wb") as f:
-                    content = await file.read()
-                    f.write(content)
-
-                # Calculate file hash
-                file_hash = calculate_file_hash(temp_path)
-
-                # Check if already exists
-                existing = await pool.fetchrow(
-                    """SELECT id, title, ingestion_count
-                       FROM documents
-                       WHERE source = $1 AND file_hash = $2 AND project_id = $3""",
-                    file.filename, file_hash, project_id
-                )
-
-                if existing:
-                    logger.info(f"File {file.filename} already exists, skipping")
-                    # Update ingestion metadata
-                    await pool.execute(
-                        "UPDATE documents SET last_ingested = NOW(), ingestion_count = ingestion_count + 1 WHERE id = $1",
-                        existing["id"]
-                    )
-                    results.append(UploadResult(
-                        filename=file.filename,
-                        success=True,
-                        chunks=0,
-                        status="skipped (already exists)"
-                    ))
-                    os.remove(temp_path)
-                    continue
-
-                # Load user-specific settings for embeddings and proxy
-                user_settings_row = await pool.fetchrow(
-                    """SELECT llm_api_key, llm_model, llm_base_url, llm_provider,
-                              embedding_api_key, embedding_model, embedding_base_url,
-                              http_proxy_host, http_proxy_port, http_proxy_username, http_proxy_password
-                       FROM user_settings WHERE user_id = $1""",
-                    user.id
+            if not project_exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project {project_id} not found"
                 )
 
-                # Process document using ingestion pipeline
-                from src.ingestion.ingest import DocumentIngestionPipeline, IngestionConfig
-
-                config = IngestionConfig(
-                    project_id=project_id,
-                    incremental=True
-                )
+            # Load user-specific settings for embeddings and proxy
+            user_settings_row = await pool.fetchrow(
+                """SELECT llm_api_key, llm_model, llm_base_url, llm_provider,
+                          embedding_api_key, embedding_model, embedding_base_url,
+                          http_proxy_host, http_proxy_port, http_proxy_username, http_proxy_password
+                   FROM user_settings WHERE user_id = $1""",
+                user.id
+            )
 
-                pipeline = DocumentIngestionPipeline(
-                    config=config,
-                    documents_folder=temp_dir,
-                    clean_before_ingest=False,
-                    project_id=project_id,
-                    user_settings=user_settings_row
-                )
-                await pipeline.initialize()
+            # One ingestion pipeline serves every file in the batch
+            config = IngestionConfig(
+                project_id=str(project_id),
+                incremental=True
+            )
 
-                # Ingest single file
-                doc_result = await pipeline._ingest_single_document(temp_path)
+            pipeline = DocumentIngestionPipeline(
+                config=config,
+                documents_folder=temp_dir,
+                clean_before_ingest=False,
+                project_id=str(project_id),
+                user_settings=user_settings_row,
+                db_pool=pool
+            )
+            await pipeline.initialize()
+
+            # Files are independent, so process them concurrently (bounded)
+            semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+            batch_keys: Set[Tuple[str, str]] = set()
+            results = await asyncio.gather(*(
+                _process_upload(file, index, temp_dir, str(project_id), pool, pipeline, semaphore, batch_keys)
+                for index, file in enumerate(files)
+            ))
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Upload error: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Upload failed: {e}"
+            )
+        finally:
+            if pipeline:
                 await pipeline.close()
 
-                results.append(UploadResult(
-                    filename=file.filename,
-                    success=len(doc_result.errors) == 0,
-                    chunks=doc_result.chunks_created,
-                    status="processed",
-                    error=doc_result.errors[0] if doc_result.errors else None
-                ))
-
-                # Clean up temp file
-                os.remove(temp_path)
-
-            except Exception as e:
-                logger.exception(f"Failed to process {file.filename}: {e}")
-                results.append(UploadResult(
-                    filename=file.filename,
-                    success=False,
-                    error=str(e)
-                ))
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception(f"Upload error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Upload failed: {e}"
-        )
-    finally:
-        # Clean up temp directory
-        try:
-            os.rmdir(temp_dir)
-        except:
-            pass
-
     return results
 
 
@@ -528,12 +628,34 @@ async def upload_files(
 # ASYNC UPLOAD FILES (with background processing)
 # ============================================================================
 
+def _failed_job_status(filename: str, error: str) -> JobStatus:
+    """
+    Build the status for a file that did not get an ingestion job.
+
+    Args:
+        filename: Original filename
+        error: Reason the file was rejected
+
+    Returns:
+        Failed job status without a job ID
+    """
+    return JobStatus(
+        job_id="",
+        filename=filename,
+        status="failed",
+        progress=0,
+        chunks_created=0,
+        error_message=error
+    )
+
+
 @router.post("/projects/{project_id}/upload-async", response_model=List[JobStatus])
 async def upload_files_async(
-    project_id: str,
+    project_id: UUID,
     files: List[UploadFile] = File(...),
     pool: asyncpg.Pool = Depends(get_db_pool),
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ) -> List[JobStatus]:
     """
     Upload files and process them in background.
@@ -544,6 +666,7 @@ async def upload_files_async(
         files: List of files to upload
         pool: Database connection pool
         user: Current authenticated user
+        settings: Application settings
 
     Returns:
         List of job statuses
@@ -551,8 +674,9 @@ async def upload_files_async(
     Raises:
         HTTPException: If upload fails or user doesn't own the project
     """
-    job_statuses = []
-    temp_dir = tempfile.mkdtemp(prefix="rag_upload_")
+    job_statuses: List[Optional[JobStatus]] = [None] * len(files)
+    jobs_started = False
+    temp_dir = tempfile.mkdtemp(prefix="rag_upload_", dir=upload_staging_dir(settings, files))
 
     try:
         # Verify user owns the project
@@ -566,53 +690,92 @@ async def upload_files_async(
                 detail=f"Project {project_id} not found"
             )
 
-        for file in files:
+        # Save every file first so duplicates are checked for the whole batch
+        saved = []
+        for index, file in enumerate(files):
             try:
                 logger.info(f"Uploading file: {file.filename} ({file.size} bytes)")
 
                 # Save file to temp directory
-                file_path = os.path.join(temp_dir, file.filename)
-                with open(file_path, "wb") as f:
-                    content = await file.read()
-                    f.write(content)
+                file_path = upload_staging_path(temp_dir, index, file.filename)
+                file_hash = await save_upload_file(file, file_path)
+                saved.append((index, file, file_path, file_hash))
 
-                # Create job record
-                job_id = await pool.fetchval(
+            except Exception as e:
+                logger.exception(f"Failed to save {file.filename}: {e}")
+                shutil.rmtree(os.path.join(temp_dir, str(index)), ignore_errors=True)
+                job_statuses[index] = _failed_job_status(file.filename, str(e))
+
+        # Find files already ingested into this project in one round trip
+        duplicates = set()
+        if saved:
+            rows = await pool.fetch(
+                """SELECT d.source, d.file_hash
+                   FROM documents d
+                   JOIN unnest($2::text[], $3::text[]) AS u(source, file_hash)
+                     ON d.source = u.source AND d.file_hash = u.file_hash
+                   WHERE d.project_id = $1""",
+                project_id,
+                [file.filename for _, file, _, _ in saved],
+                [file_hash for _, _, _, file_hash in saved]
+            )
+            duplicates = {(row["source"], row["file_hash"]) for row in rows}
+
+        new_files = []
+        for index, file, file_path, file_hash in saved:
+            key = (file.filename, file_hash)
+            if key in duplicates:
+                logger.warning(f"File {file.filename} already exists (duplicate)")
+                remove_staged_upload(file_path)
+                job_statuses[index] = _failed_job_status(file.filename, DUPLICATE_FILE_ERROR)
+            else:
+                # Later copies of the same file in this batch count as duplicates
+                duplicates.add(key)
+                new_files.append((index, file, file_path, file_hash))
+
+        if new_files:
+            # Create all job records in one statement; IDs are generated here
+            # so each job maps back to its file without relying on row order
+            job_ids = [uuid.uuid4() for _ in new_files]
+            try:
+                await pool.execute(
                     """INSERT INTO ingestion_jobs
-                       (project_id, user_id, filename, file_size, status, progress)
-                       VALUES ($1, $2, $3, $4, 'pending', 0)
-                       RETURNING id""",
-                    project_id, user.id, file.filename, file.size or 0
+                       (id, project_id, user_id, filename, file_size, status, progress)
+                       SELECT j.id, $1, $2, j.filename, j.file_size, 'pending', 0
+                       FROM unnest($3::uuid[], $4::text[], $5::bigint[]) AS j(id, filename, file_size)""",
+                    project_id,
+                    user.id,
+                    job_ids,
+                    [file.filename for _, file, _, _ in new_files],
+                    [file.size or 0 for _, file, _, _ in new_files]
                 )
-
-                # Start background processing
+            except Exception as e:
+                logger.exception(f"Failed to create ingestion jobs: {e}")
+                for index, file, file_path, _ in new_files:
+                    remove_staged_upload(file_path)
+                    job_statuses[index] = _failed_job_status(file.filename, str(e))
+                new_files = []
+
+            for job_id, (index, file, file_path, file_hash) in zip(job_ids, new_files):
+                # Start background processing; each job removes its own
+                # file and the last one removes the batch directory
                 asyncio.create_task(
                     process_file_background(
-                        str(job_id), file_path, file.filename, project_id, user.id
+                        pool, str(job_id), file_path, file.filename, str(project_id), user.id, file_hash
                     )
                 )
+                jobs_started = True
 
-                job_statuses.append(JobStatus(
+                job_statuses[index] = JobStatus(
                     job_id=str(job_id),
                     filename=file.filename,
                     status="pending",
                     progress=0,
                     chunks_created=0
-                ))
+                )
 
                 logger.info(f"Created job {job_id} for {file.filename}")
 
-            except Exception as e:
-                logger.exception(f"Failed to start job for {file.filename}: {e}")
-                job_statuses.append(JobStatus(
-                    job_id="",
-                    filename=file.filename,
-                    status="failed",
-                    progress=0,
-                    chunks_created=0,
-                    error_message=str(e)
-                ))
-
     except HTTPException:
         raise
     except Exception as e:
@@ -621,5 +784,9 @@ async def upload_files_async(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Upload failed: {e}"
         )
+    finally:
+        # Nothing is left for a background job to process
+        if not jobs_started:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     return job_statuses
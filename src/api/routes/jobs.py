@@ -1,21 +1,133 @@
 """Background job status routes."""
 
+import asyncio
+import json
 import logging
-from typing import List
+from uuid import UUID
+from typing import AsyncGenerator, Dict, List, Optional, Set
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from src.api.models.jobs import IngestionJob, JobStatus
-from src.api.dependencies import get_db_pool, get_current_user
+from src.api.dependencies import get_db_pool, get_current_user, get_settings
 from src.api.models.auth import User
+from src.api.utils import JOB_UPDATES_CHANNEL
+from src.settings import Settings
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["jobs"])
 
+# Job states after which no further updates are published
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed"})
+
+# Comment frame sent while waiting so proxies keep the stream open
+JOB_EVENTS_KEEPALIVE_SECONDS = 15
+
+
+# ============================================================================
+# JOB UPDATE LISTENER
+# ============================================================================
+
+# One LISTEN connection per process fans NOTIFY payloads out to the event
+# streams subscribed to each job. It is a dedicated connection rather than a
+# pool checkout so event streams never hold pool capacity.
+_job_listener: Optional[asyncpg.Connection] = None
+_job_listener_lock = asyncio.Lock()
+_job_listener_settings: Optional[Settings] = None
+_job_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+# Columns needed to build a JobStatus
+JOB_STATUS_SQL = """SELECT id, filename, status, progress, chunks_created, error_message
+                    FROM ingestion_jobs
+                    WHERE id = $1 AND user_id = $2"""
+
+
+def _on_job_update(connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+    """Dispatch a job update notification to the job's subscribers."""
+    try:
+        update = json.loads(payload)
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring malformed job update: {payload[:200]}")
+        return
+
+    for queue in _job_subscribers.get(update.get("job_id"), ()):
+        queue.put_nowait(update)
+
+
+def _unsubscribe(job_id: str, queue: asyncio.Queue) -> None:
+    """Remove an event stream's queue from the job's subscribers."""
+    subscribers = _job_subscribers.get(job_id)
+    if subscribers is None:
+        return
+    subscribers.discard(queue)
+    if not subscribers:
+        del _job_subscribers[job_id]
+
+
+async def _ensure_job_listener(settings: Settings) -> None:
+    """Open the shared LISTEN connection if it is not running."""
+    global _job_listener, _job_listener_settings
+    async with _job_listener_lock:
+        _job_listener_settings = settings
+        if _job_listener is None or _job_listener.is_closed():
+            _job_listener = await asyncpg.connect(settings.database_url)
+            _job_listener.add_termination_listener(_on_job_listener_terminated)
+            await _job_listener.add_listener(JOB_UPDATES_CHANNEL, _on_job_update)
+            logger.info("Listening for ingestion job updates")
+
+
+async def _reconnect_job_listener() -> None:
+    """Re-establish the LISTEN connection after it was lost."""
+    if _job_listener_settings is None or not _job_subscribers:
+        # Nobody is waiting; the next event stream reconnects on demand
+        return
+    try:
+        await _ensure_job_listener(_job_listener_settings)
+    except Exception as e:
+        # Streams fall back to re-reading the job on every keepalive and retry then
+        logger.warning(f"Failed to reconnect job update listener: {e}")
+
+
+def _on_job_listener_terminated(connection: asyncpg.Connection) -> None:
+    """Drop the lost LISTEN connection (DB restart, idle timeout) and reconnect."""
+    global _job_listener
+    if connection is not _job_listener:
+        return
+    logger.warning("Job update listener connection lost, reconnecting")
+    _job_listener = None
+    asyncio.get_running_loop().create_task(_reconnect_job_listener())
+
+
+async def close_job_listener() -> None:
+    """Close the shared LISTEN connection (call on application shutdown)."""
+    global _job_listener
+    listener, _job_listener = _job_listener, None
+    if listener is not None and not listener.is_closed():
+        listener.remove_termination_listener(_on_job_listener_terminated)
+        await listener.close()
+
+
+def _row_to_job_status(row: asyncpg.Record) -> JobStatus:
+    """Build a JobStatus from a row selected with JOB_STATUS_SQL."""
+    return JobStatus(
+        job_id=str(row["id"]),
+        filename=row["filename"],
+        status=row["status"],
+        progress=row["progress"] or 0,
+        chunks_created=row["chunks_created"] or 0,
+        error_message=row["error_message"]
+    )
+
+
+def _encode_job_event(job: JobStatus) -> bytes:
+    """Frame a job status as a Server-Sent Events message."""
+    return b"event: job\ndata: %s\n\n" % job.model_dump_json().encode()
+
 
 @router.get("/jobs/{job_id}", response_model=JobStatus)
 async def get_job_status(
-    job_id: str,
+    job_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> JobStatus:
@@ -34,12 +146,7 @@ async def get_job_status(
         HTTPException: If job not found or user doesn't have access
     """
     try:
-        row = await pool.fetchrow(
-            """SELECT id, filename, status, progress, chunks_created, error_message
-               FROM ingestion_jobs
-               WHERE id = $1 AND user_id = $2""",
-            job_id, user.id
-        )
+        row = await pool.fetchrow(JOB_STATUS_SQL, job_id, user.id)
 
         if not row:
             raise HTTPException(
@@ -47,14 +154,7 @@ async def get_job_status(
                 detail=f"Job {job_id} not found"
             )
 
-        return JobStatus(
-            job_id=str(row["id"]),
-            filename=row["filename"],
-            status=row["status"],
-            progress=row["progress"] or 0,
-            chunks_created=row["chunks_created"] or 0,
-            error_message=row["error_message"]
-        )
+        return _row_to_job_status(row)
 
     except HTTPException:
         raise
@@ -68,7 +168,7 @@ async def get_job_status(
 
 @router.get("/projects/{project_id}/jobs", response_model=List[IngestionJob])
 async def get_project_jobs(
-    project_id: str,
+    project_id: UUID,
     limit: int = 50,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
@@ -138,3 +238,102 @@ async def get_project_jobs(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get jobs: {e}"
         )
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: UUID,
+    pool: asyncpg.Pool = Depends(get_db_pool),
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+) -> StreamingResponse:
+    """
+    Stream status changes of a background ingestion job via Server-Sent Events.
+
+    Sends the current status first, then every update until the job completes
+    or fails, so clients don't have to poll get_job_status.
+
+    Args:
+        job_id: Job UUID
+        pool: Database connection pool
+        user: Current authenticated user
+        settings: Application settings
+
+    Returns:
+        StreamingResponse with SSE events
+
+    Raises:
+        HTTPException: If job not found or user doesn't have access
+    """
+    # Notifications carry the canonical UUID text
+    job_key = str(job_id)
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    try:
+        await _ensure_job_listener(settings)
+
+        # Subscribe before reading the current state so no update is missed
+        _job_subscribers.setdefault(job_key, set()).add(queue)
+
+        row = await pool.fetchrow(JOB_STATUS_SQL, job_id, user.id)
+
+    except Exception as e:
+        _unsubscribe(job_key, queue)
+        logger.exception(f"Error subscribing to job events: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream job events: {e}"
+        )
+
+    if not row:
+        _unsubscribe(job_key, queue)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        """Generate SSE events for the job."""
+        try:
+            job = _row_to_job_status(row)
+            yield _encode_job_event(job)
+
+            while job.status not in TERMINAL_JOB_STATUSES:
+                try:
+                    update = await asyncio.wait_for(queue.get(), JOB_EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Notifications are lost while the listener is down, so
+                    # reconnect if needed and catch up from the job row
+                    try:
+                        await _ensure_job_listener(settings)
+                    except Exception as e:
+                        logger.warning(f"Job update listener unavailable: {e}")
+
+                    current_row = await pool.fetchrow(JOB_STATUS_SQL, job_id, user.id)
+                    if current_row is None:
+                        break
+
+                    current = _row_to_job_status(current_row)
+                    if current != job:
+                        job = current
+                        yield _encode_job_event(job)
+                    else:
+                        yield b": keepalive\n\n"
+                    continue
+
+                job = JobStatus(**update)
+                yield _encode_job_event(job)
+
+        finally:
+            _unsubscribe(job_key, queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
@@ -1,13 +1,14 @@
 """Chat message management routes."""
 
-import json
 import logging
-from typing import List, Dict, Any
+from uuid import UUID
+from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.api.models.requests import MessageCreate
 from src.api.models.responses import Message
 from src.api.dependencies import get_db_pool
+from src.api.utils import parse_metadata
 import asyncpg
 
 logger = logging.getLogger(__name__)
@@ -15,35 +16,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["messages"])
 
 
-def parse_metadata(metadata: Any) -> Dict[str, Any]:
-    """
-    Safely parse metadata from database to dict.
-
-    Args:
-        metadata: Metadata from database (can be dict, str, or None)
-
-    Returns:
-        Dict with metadata
-    """
-    if metadata is None:
-        return {}
-    if isinstance(metadata, dict):
-        return metadata
-    if isinstance(metadata, str):
-        try:
-            return json.loads(metadata)
-        except json.JSONDecodeError:
-            return {}
-    return {}
-
-
 # ============================================================================
 # GET SESSION MESSAGES
 # ============================================================================
 
 @router.get("/sessions/{session_id}/messages", response_model=List[Message])
 async def get_session_messages(
-    session_id: str,
+    session_id: UUID,
     limit: int = 100,
     pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> List[Message]:
@@ -94,7 +73,7 @@ async def get_session_messages(
 
 @router.post("/sessions/{session_id}/messages", response_model=Message, status_code=status.HTTP_201_CREATED)
 async def add_message(
-    session_id: str,
+    session_id: UUID,
     message_data: MessageCreate,
     pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> Message:
@@ -113,31 +92,23 @@ async def add_message(
         HTTPException: If session not found or creation fails
     """
     try:
-        # Verify session exists
-        session_exists = await pool.fetchval(
-            "SELECT id FROM chat_sessions WHERE id = $1",
-            session_id
-        )
-        if not session_exists:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Session {session_id} not found"
-            )
-
-        message_id = await pool.fetchval(
+        # Inserts only if the session exists, so no separate lookup is needed
+        row = await pool.fetchrow(
             """INSERT INTO chat_messages (session_id, role, content, metadata)
-               VALUES ($1, $2, $3, $4::jsonb) RETURNING id""",
+               SELECT $1::uuid, $2, $3, $4::jsonb
+               WHERE EXISTS (SELECT 1 FROM chat_sessions WHERE id = $1::uuid)
+               RETURNING id, session_id, role, content, metadata, created_at""",
             session_id,
             message_data.role,
             message_data.content,
-            json.dumps(message_data.metadata or {})
+            message_data.metadata or {}
         )
 
-        row = await pool.fetchrow(
-            """SELECT id, session_id, role, content, metadata, created_at
-               FROM chat_messages WHERE id = $1""",
-            message_id
-        )
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session {session_id} not found"
+            )
 
         return Message(
             id=str(row["id"]),
@@ -164,7 +135,7 @@ async def add_message(
 
 @router.delete("/sessions/{session_id}/messages", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_session_messages(
-    session_id: str,
+    session_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> None:
     """
@@ -1,12 +1,14 @@
 """Project management routes."""
 
 import logging
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+from typing import Optional, List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from src.api.models.requests import ProjectCreate, ProjectUpdate
 from src.api.models.responses import Project
-from src.api.dependencies import get_db_pool, get_current_user
+from src.api.dependencies import get_db_pool, get_current_user, get_settings
 from src.api.models.auth import User
 from src.settings import Settings
 import asyncpg
@@ -15,6 +17,54 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+# Columns needed to build a Project response (counts are trigger-maintained)
+PROJECT_COLUMNS = "id, name, description, created_at, updated_at, doc_count, session_count"
+
+
+# Updatable columns, in the order their values are bound
+PROJECT_UPDATE_FIELDS = ("name", "description")
+
+
+def _build_project_update_sql(fields: Tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for a set of project fields.
+
+    Args:
+        fields: Names of the fields being updated, in PROJECT_UPDATE_FIELDS order
+
+    Returns:
+        SQL taking the field values in order, then the project ID and user ID
+    """
+    assignments = ", ".join(f"{field} = ${i}" for i, field in enumerate(fields, start=1))
+    return f"""UPDATE projects SET {assignments}, updated_at = NOW()
+               WHERE id = ${len(fields) + 1} AND user_id = ${len(fields) + 2}
+               RETURNING {PROJECT_COLUMNS}"""
+
+
+# One statement per non-empty field combination, built once so updates reuse
+# identical SQL text (and asyncpg's prepared statement cache)
+UPDATE_PROJECT_SQL = {
+    fields: _build_project_update_sql(fields)
+    for fields in (("name",), ("description",), PROJECT_UPDATE_FIELDS)
+}
+
+
+# Serializes list responses without re-validating trusted database rows
+_project_list_adapter = TypeAdapter(List[Project])
+
+
+def _row_to_project(row: asyncpg.Record) -> Project:
+    """Build a Project response from a row selected with PROJECT_COLUMNS."""
+    return Project.model_construct(
+        id=row["id"],
+        name=row["name"],
+        description=row["description"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        doc_count=row["doc_count"] or 0,
+        session_count=row["session_count"] or 0
+    )
+
 
 # ============================================================================
 # LIST PROJECTS
@@ -26,7 +76,7 @@ async def list_projects(
     limit: int = 100,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
-) -> List[Project]:
+) -> Response:
     """
     List all projects for current user with optional search.
 
@@ -42,45 +92,27 @@ async def list_projects(
     try:
         if search:
             rows = await pool.fetch(
-                """SELECT p.id, p.name, p.description, p.created_at, p.updated_at,
-                          COUNT(DISTINCT d.id) as doc_count,
-                          COUNT(DISTINCT s.id) as session_count
-                   FROM projects p
-                   LEFT JOIN documents d ON d.project_id = p.id
-                   LEFT JOIN chat_sessions s ON s.project_id = p.id
-                   WHERE p.user_id = $1 AND (p.name ILIKE $2 OR p.description ILIKE $2)
-                   GROUP BY p.id
-                   ORDER BY p.updated_at DESC
+                f"""SELECT {PROJECT_COLUMNS}
+                   FROM projects
+                   WHERE user_id = $1 AND (name ILIKE $2 OR description ILIKE $2)
+                   ORDER BY updated_at DESC
                    LIMIT $3""",
                 user.id, f"%{search}%", limit
             )
         else:
             rows = await pool.fetch(
-                """SELECT p.id, p.name, p.description, p.created_at, p.updated_at,
-                          COUNT(DISTINCT d.id) as doc_count,
-                          COUNT(DISTINCT s.id) as session_count
-                   FROM projects p
-                   LEFT JOIN documents d ON d.project_id = p.id
-                   LEFT JOIN chat_sessions s ON s.project_id = p.id
-                   WHERE p.user_id = $1
-                   GROUP BY p.id
-                   ORDER BY p.updated_at DESC
+                f"""SELECT {PROJECT_COLUMNS}
+                   FROM projects
+                   WHERE user_id = $1
+                   ORDER BY updated_at DESC
                    LIMIT $2""",
                 user.id, limit
             )
 
-        return [
-            Project(
-                id=str(row["id"]),
-                name=row["name"],
-                description=row["description"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                doc_count=row["doc_count"] or 0,
-                session_count=row["session_count"] or 0
-            )
-            for row in rows
-        ]
+        return Response(
+            content=_project_list_adapter.dump_json([_row_to_project(row) for row in rows]),
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.exception(f"Error listing projects: {e}")
@@ -96,7 +128,7 @@ async def list_projects(
 
 @router.get("/{project_id}", response_model=Project)
 async def get_project(
-    project_id: str,
+    project_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> Project:
@@ -116,14 +148,9 @@ async def get_project(
     """
     try:
         row = await pool.fetchrow(
-            """SELECT p.id, p.name, p.description, p.created_at, p.updated_at,
-                      COUNT(DISTINCT d.id) as doc_count,
-                      COUNT(DISTINCT s.id) as session_count
-               FROM projects p
-               LEFT JOIN documents d ON d.project_id = p.id
-               LEFT JOIN chat_sessions s ON s.project_id = p.id
-               WHERE p.id = $1 AND p.user_id = $2
-               GROUP BY p.id""",
+            f"""SELECT {PROJECT_COLUMNS}
+               FROM projects
+               WHERE id = $1 AND user_id = $2""",
             project_id, user.id
         )
 
@@ -133,15 +160,7 @@ async def get_project(
                 detail=f"Project {project_id} not found"
             )
 
-        return Project(
-            id=str(row["id"]),
-            name=row["name"],
-            description=row["description"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            doc_count=row["doc_count"] or 0,
-            session_count=row["session_count"] or 0
-        )
+        return _row_to_project(row)
 
     except HTTPException:
         raise
@@ -178,30 +197,17 @@ async def create_project(
         HTTPException: If project name already exists or creation fails
     """
     try:
-        project_id = await pool.fetchval(
-            "INSERT INTO projects (name, description, user_id) VALUES ($1, $2, $3) RETURNING id",
+        row = await pool.fetchrow(
+            f"""INSERT INTO projects (name, description, user_id) VALUES ($1, $2, $3)
+                RETURNING {PROJECT_COLUMNS}""",
             project_data.name,
             project_data.description,
             user.id
         )
 
-        row = await pool.fetchrow(
-            """SELECT id, name, description, created_at, updated_at
-               FROM projects WHERE id = $1""",
-            project_id
-        )
+        logger.info(f"Created project: {project_data.name} (id={row['id']})")
 
-        logger.info(f"Created project: {project_data.name} (id={project_id})")
-
-        return Project(
-            id=str(row["id"]),
-            name=row["name"],
-            description=row["description"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            doc_count=0,
-            session_count=0
-        )
+        return _row_to_project(row)
 
     except asyncpg.UniqueViolationError:
         raise HTTPException(
@@ -216,13 +222,78 @@ async def create_project(
         )
 
 
+# ============================================================================
+# BULK CREATE PROJECTS
+# ============================================================================
+
+@router.post("/bulk", response_model=List[Project], status_code=status.HTTP_201_CREATED)
+async def create_projects_bulk(
+    projects_data: List[ProjectCreate],
+    pool: asyncpg.Pool = Depends(get_db_pool),
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+) -> Response:
+    """
+    Create several projects for the current user in one transaction.
+
+    Args:
+        projects_data: Project creation data, one entry per project
+        pool: Database connection pool
+        user: Current authenticated user
+        settings: Application settings (bulk insert batch size)
+
+    Returns:
+        Created projects
+
+    Raises:
+        HTTPException: If a project name already exists or creation fails
+    """
+    try:
+        batch_size = settings.bulk_insert_batch_size
+        rows = []
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                for start in range(0, len(projects_data), batch_size):
+                    batch = projects_data[start:start + batch_size]
+                    rows.extend(await conn.fetch(
+                        f"""INSERT INTO projects (name, description, user_id)
+                            SELECT name, description, $3
+                            FROM unnest($1::text[], $2::text[]) AS t(name, description)
+                            RETURNING {PROJECT_COLUMNS}""",
+                        [item.name for item in batch],
+                        [item.description for item in batch],
+                        user.id
+                    ))
+
+        logger.info(f"Created {len(rows)} projects in bulk (user={user.id})")
+
+        return Response(
+            content=_project_list_adapter.dump_json([_row_to_project(row) for row in rows]),
+            media_type="application/json",
+            status_code=status.HTTP_201_CREATED
+        )
+
+    except asyncpg.UniqueViolationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Project already exists: {e.detail or e}"
+        )
+    except Exception as e:
+        logger.exception(f"Error creating projects: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create projects: {e}"
+        )
+
+
 # ============================================================================
 # UPDATE PROJECT
 # ============================================================================
 
 @router.put("/{project_id}", response_model=Project)
 async def update_project(
-    project_id: str,
+    project_id: UUID,
     project_data: ProjectUpdate,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
@@ -243,37 +314,29 @@ async def update_project(
         HTTPException: If project not found or update fails
     """
     try:
-        updates = []
-        params = []
-        param_count = 1
-
-        if project_data.name is not None:
-            updates.append(f"name = ${param_count}")
-            params.append(project_data.name)
-            param_count += 1
-
-        if project_data.description is not None:
-            updates.append(f"description = ${param_count}")
-            params.append(project_data.description)
-            param_count += 1
+        fields = tuple(
+            field for field in PROJECT_UPDATE_FIELDS
+            if getattr(project_data, field) is not None
+        )
 
-        if not updates:
+        if not fields:
             # No updates, return existing project
             return await get_project(project_id, pool, user)
 
-        params.append(project_id)
-        params.append(user.id)
-        query = f"UPDATE projects SET {', '.join(updates)}, updated_at = NOW() WHERE id = ${param_count} AND user_id = ${param_count + 1}"
-
-        result = await pool.execute(query, *params)
+        row = await pool.fetchrow(
+            UPDATE_PROJECT_SQL[fields],
+            *(getattr(project_data, field) for field in fields),
+            project_id,
+            user.id
+        )
 
-        if "UPDATE 1" not in result:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project {project_id} not found"
             )
 
-        return await get_project(project_id, pool)
+        return _row_to_project(row)
 
     except HTTPException:
         raise
@@ -296,7 +359,7 @@ async def update_project(
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
-    project_id: str,
+    project_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> None:
@@ -1,8 +1,10 @@
 """Chat session management routes."""
 
 import logging
+from uuid import UUID
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from src.api.models.requests import SessionCreate, SessionUpdate
 from src.api.models.responses import Session
@@ -14,6 +16,25 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["sessions"])
 
+# Columns needed to build a Session response (message_count is trigger-maintained)
+SESSION_COLUMNS = "id, project_id, title, created_at, updated_at, message_count"
+
+
+# Serializes list responses without re-validating trusted database rows
+_session_list_adapter = TypeAdapter(List[Session])
+
+
+def _row_to_session(row: asyncpg.Record) -> Session:
+    """Build a Session response from a row selected with SESSION_COLUMNS."""
+    return Session.model_construct(
+        id=row["id"],
+        project_id=row["project_id"],
+        title=row["title"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        message_count=row["message_count"] or 0
+    )
+
 
 # ============================================================================
 # LIST SESSIONS
@@ -21,11 +42,11 @@ router = APIRouter(prefix="/api", tags=["sessions"])
 
 @router.get("/projects/{project_id}/sessions", response_model=List[Session])
 async def list_sessions(
-    project_id: str,
+    project_id: UUID,
     limit: int = 50,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
-) -> List[Session]:
+) -> Response:
     """
     List all sessions for a project (verifies user owns the project).
 
@@ -54,27 +75,21 @@ async def list_sessions(
             )
 
         rows = await pool.fetch(
-            """SELECT id, project_id, title, created_at, updated_at,
-                      (SELECT COUNT(*) FROM chat_messages WHERE session_id = cs.id) as message_count
-               FROM chat_sessions cs
+            f"""SELECT {SESSION_COLUMNS}
+               FROM chat_sessions
                WHERE project_id = $1
                ORDER BY updated_at DESC
                LIMIT $2""",
             project_id, limit
         )
 
-        return [
-            Session(
-                id=str(row["id"]),
-                project_id=str(row["project_id"]),
-                title=row["title"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                message_count=row["message_count"] or 0
-            )
-            for row in rows
-        ]
+        return Response(
+            content=_session_list_adapter.dump_json([_row_to_session(row) for row in rows]),
+            media_type="application/json"
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Error listing sessions: {e}")
         raise HTTPException(
@@ -89,7 +104,7 @@ async def list_sessions(
 
 @router.get("/sessions/{session_id}", response_model=Session)
 async def get_session(
-    session_id: str,
+    session_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> Session:
@@ -109,8 +124,7 @@ async def get_session(
     """
     try:
         row = await pool.fetchrow(
-            """SELECT cs.id, cs.project_id, cs.title, cs.created_at, cs.updated_at,
-                      (SELECT COUNT(*) FROM chat_messages WHERE session_id = cs.id) as message_count
+            """SELECT cs.id, cs.project_id, cs.title, cs.created_at, cs.updated_at, cs.message_count
                FROM chat_sessions cs
                JOIN projects p ON cs.project_id = p.id
                WHERE cs.id = $1 AND p.user_id = $2""",
@@ -123,14 +137,7 @@ async def get_session(
                 detail=f"Session {session_id} not found"
             )
 
-        return Session(
-            id=str(row["id"]),
-            project_id=str(row["project_id"]),
-            title=row["title"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            message_count=row["message_count"] or 0
-        )
+        return _row_to_session(row)
 
     except HTTPException:
         raise
@@ -148,7 +155,7 @@ async def get_session(
 
 @router.post("/projects/{project_id}/sessions", response_model=Session, status_code=status.HTTP_201_CREATED)
 async def create_session(
-    project_id: str,
+    project_id: UUID,
     session_data: SessionCreate,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
@@ -169,39 +176,24 @@ async def create_session(
         HTTPException: If creation fails or user doesn't own the project
     """
     try:
-        # Verify user owns the project
-        project_exists = await pool.fetchval(
-            "SELECT id FROM projects WHERE id = $1 AND user_id = $2",
-            project_id, user.id
+        # Insert only if the user owns the project (ownership check in the same statement)
+        row = await pool.fetchrow(
+            f"""INSERT INTO chat_sessions (project_id, title)
+                SELECT id, $3 FROM projects WHERE id = $1 AND user_id = $2
+                RETURNING {SESSION_COLUMNS}""",
+            project_id,
+            user.id,
+            session_data.title or "New Chat"
         )
-        if not project_exists:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project {project_id} not found"
             )
 
-        session_id = await pool.fetchval(
-            "INSERT INTO chat_sessions (project_id, title) VALUES ($1, $2) RETURNING id",
-            project_id,
-            session_data.title or "New Chat"
-        )
+        logger.info(f"Created session: {session_data.title} (project={project_id}, id={row['id']})")
 
-        row = await pool.fetchrow(
-            """SELECT id, project_id, title, created_at, updated_at
-               FROM chat_sessions WHERE id = $1""",
-            session_id
-        )
-
-        logger.info(f"Created session: {session_data.title} (project={project_id}, id={session_id})")
-
-        return Session(
-            id=str(row["id"]),
-            project_id=str(row["project_id"]),
-            title=row["title"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            message_count=0
-        )
+        return _row_to_session(row)
 
     except HTTPException:
         raise
@@ -219,7 +211,7 @@ async def create_session(
 
 @router.put("/sessions/{session_id}", response_model=Session)
 async def update_session(
-    session_id: str,
+    session_id: UUID,
     session_data: SessionUpdate,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
@@ -241,22 +233,23 @@ async def update_session(
     """
     try:
         # Update and verify ownership in one query
-        result = await pool.execute(
-            """UPDATE chat_sessions
-               SET title = $1, updated_at = NOW()
-               WHERE id = $2 AND project_id IN (SELECT id FROM projects WHERE user_id = $3)""",
+        row = await pool.fetchrow(
+            f"""UPDATE chat_sessions
+                SET title = $1, updated_at = NOW()
+                WHERE id = $2 AND project_id IN (SELECT id FROM projects WHERE user_id = $3)
+                RETURNING {SESSION_COLUMNS}""",
             session_data.title,
             session_id,
             user.id
         )
 
-        if "UPDATE 1" not in result:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Session {session_id} not found"
             )
 
-        return await get_session(session_id, pool)
+        return _row_to_session(row)
 
     except HTTPException:
         raise
@@ -274,7 +267,7 @@ async def update_session(
 
 @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
-    session_id: str,
+    session_id: UUID,
     pool: asyncpg.Pool = Depends(get_db_pool),
     user: User = Depends(get_current_user)
 ) -> None:
@@ -6,8 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.api.models.requests import SettingsUpdate
 from src.api.models.responses import SettingsResponse
-from src.api.dependencies import get_settings
-from src.settings import Settings, load_settings
+from src.api.dependencies import get_settings, clear_settings_cache
+from src.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -139,7 +139,8 @@ async def update_app_settings(
         logger.info("Settings saved to .env file")
 
         # Reload and return updated settings
-        updated_settings = load_settings()
+        clear_settings_cache()
+        updated_settings = await get_settings()
 
         return SettingsResponse(
             llm_model=updated_settings.llm_model,
@@ -0,0 +1,119 @@
+"""Shared helpers for API routes."""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+import asyncpg
+from fastapi import Request, Response, status
+
+
+# ============================================================================
+# METADATA
+# ============================================================================
+
+def parse_metadata(metadata: Any) -> Dict[str, Any]:
+    """
+    Safely parse metadata from database to dict.
+
+    Args:
+        metadata: Metadata from database (can be dict, str, or None)
+
+    Returns:
+        Dict with metadata
+    """
+    if metadata is None:
+        return {}
+    if isinstance(metadata, dict):
+        return metadata
+    if isinstance(metadata, str):
+        try:
+            return json.loads(metadata)
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+
+# ============================================================================
+# CONDITIONAL REQUESTS (ETag)
+# ============================================================================
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from values that change whenever a resource changes.
+
+    Args:
+        parts: Version markers (IDs, timestamps, counters)
+
+    Returns:
+        Quoted weak ETag value
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has this version.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        Body-less 304 response, or None if the resource must be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+    return None
+
+
+def etag_headers(etag: str) -> dict:
+    """
+    Headers that make clients revalidate cached responses with the ETag.
+
+    Args:
+        etag: Current ETag of the resource
+
+    Returns:
+        Response headers
+    """
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+# ============================================================================
+# INGESTION JOB UPDATES
+# ============================================================================
+
+# NOTIFY channel carrying ingestion job state changes (see routes/jobs.py)
+JOB_UPDATES_CHANNEL = "job_updates"
+
+
+async def update_ingestion_job(pool: asyncpg.Pool, job_id: str, assignments: str, *args: Any) -> None:
+    """
+    Update an ingestion job and publish its new state in the same statement.
+
+    Args:
+        pool: Database connection pool
+        job_id: Job UUID (bound as $1)
+        assignments: SET clause; further parameters start at $2
+        args: Values for the SET clause parameters
+    """
+    await pool.execute(
+        f"""WITH job AS (
+               UPDATE ingestion_jobs SET {assignments}
+               WHERE id = $1
+               RETURNING id, filename, status, progress, chunks_created, error_message
+           )
+           SELECT pg_notify('{JOB_UPDATES_CHANNEL}', json_build_object(
+               'job_id', id,
+               'filename', filename,
+               'status', status,
+               'progress', COALESCE(progress, 0),
+               'chunks_created', COALESCE(chunks_created, 0),
+               'error_message', left(error_message, 2000)
+           )::text)
+           FROM job""",
+        job_id, *args
+    )
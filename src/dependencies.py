@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List, AsyncIterator
+import json
 import logging
 import asyncpg
 import httpx
@@ -13,6 +14,35 @@ from src.settings import load_settings
 
 logger = logging.getLogger(__name__)
 
+# HTTP clients shared across requests, keyed by proxy URL, so connections
+# to the LLM/embedding APIs are reused instead of re-established per call
+_http_clients: Dict[Optional[str], httpx.AsyncClient] = {}
+
+
+def get_http_client(proxy_url: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    Get a shared HTTP client for the given proxy.
+
+    Args:
+        proxy_url: Optional proxy URL
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    client = _http_clients.get(proxy_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(proxy=proxy_url, timeout=60.0)
+        _http_clients[proxy_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 @dataclass
 class AgentDependencies:
@@ -30,6 +60,9 @@ class AgentDependencies:
     user_preferences: Dict[str, Any] = field(default_factory=dict)
     query_history: list = field(default_factory=list)
 
+    # Whether initialize() created db_pool (a borrowed pool is left open)
+    _owns_db_pool: bool = field(default=False, repr=False)
+
     async def initialize(self) -> None:
         """
         Initialize external connections.
@@ -41,7 +74,7 @@ class AgentDependencies:
             self.settings = load_settings()
             logger.info(f"settings_loaded, database={self.settings.database_name}")
 
-        # Initialize PostgreSQL connection pool
+        # Initialize PostgreSQL connection pool (unless an existing pool was passed in)
         if not self.db_pool:
             try:
                 self.db_pool = await asyncpg.create_pool(
@@ -50,6 +83,7 @@ class AgentDependencies:
                     max_size=10,
                     command_timeout=60
                 )
+                self._owns_db_pool = True
                 # Test connection
                 async with self.db_pool.acquire() as conn:
                     await conn.fetchval("SELECT 1")
@@ -60,22 +94,9 @@ class AgentDependencies:
 
         # Initialize OpenAI client for LLM (not embeddings)
         if not self.openai_client:
-            # Build proxy configuration if user has proxy settings
-            http_client = None
-            if self.user_settings and self.user_settings.get("http_proxy_host"):
-                proxy_host = self.user_settings["http_proxy_host"]
-                proxy_port = self.user_settings["http_proxy_port"]
-                proxy_username = self.user_settings.get("http_proxy_username")
-                proxy_password = self.user_settings.get("http_proxy_password")
-
-                # Build proxy URL
-                if proxy_username and proxy_password:
-                    proxy_url = f"http://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-                else:
-                    proxy_url = f"http://{proxy_host}:{proxy_port}"
-
-                logger.info(f"Using HTTP proxy: {proxy_host}:{proxy_port}")
-                http_client = httpx.AsyncClient(proxy=proxy_url, timeout=60.0)
+            proxy_url = self._get_proxy_url()
+            if proxy_url:
+                logger.info(f"Using HTTP proxy: {self.user_settings['http_proxy_host']}:{self.user_settings['http_proxy_port']}")
 
             # Use user settings if available, otherwise fall back to global settings
             api_key = (self.user_settings.get("llm_api_key") or self.settings.llm_api_key) if self.user_settings else self.settings.llm_api_key
@@ -85,16 +106,31 @@ class AgentDependencies:
             self.openai_client = openai.AsyncOpenAI(
                 api_key=api_key,
                 base_url=base_url,
-                http_client=http_client
+                http_client=get_http_client(proxy_url)
             )
-            logger.info(f"openai_client_initialized, model={model}, proxy={bool(http_client)}")
+            logger.info(f"openai_client_initialized, model={model}, proxy={bool(proxy_url)}")
 
     async def cleanup(self) -> None:
         """Clean up external connections."""
-        if self.db_pool:
+        if self.db_pool and self._owns_db_pool:
             await self.db_pool.close()
-            self.db_pool = None
             logger.info("postgresql_connection_closed")
+        self.db_pool = None
+        self._owns_db_pool = False
+
+    def _get_proxy_url(self) -> Optional[str]:
+        """Build HTTP proxy URL from user settings, if configured."""
+        if not (self.user_settings and self.user_settings.get("http_proxy_host")):
+            return None
+
+        proxy_host = self.user_settings["http_proxy_host"]
+        proxy_port = self.user_settings["http_proxy_port"]
+        proxy_username = self.user_settings.get("http_proxy_username")
+        proxy_password = self.user_settings.get("http_proxy_password")
+
+        if proxy_username and proxy_password:
+            return f"http://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
+        return f"http://{proxy_host}:{proxy_port}"
 
     async def get_embedding(self, text: str) -> list[float]:
         """
@@ -109,51 +145,37 @@ class AgentDependencies:
         Raises:
             Exception: If embedding generation fails
         """
-        # Build proxy configuration if user has proxy settings
-        proxy_url = None
-        if self.user_settings and self.user_settings.get("http_proxy_host"):
-            proxy_host = self.user_settings["http_proxy_host"]
-            proxy_port = self.user_settings["http_proxy_port"]
-            proxy_username = self.user_settings.get("http_proxy_username")
-            proxy_password = self.user_settings.get("http_proxy_password")
-
-            # Build proxy URL
-            if proxy_username and proxy_password:
-                proxy_url = f"http://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-            else:
-                proxy_url = f"http://{proxy_host}:{proxy_port}"
-
         # Use user settings if available, otherwise fall back to global settings
         api_key = (self.user_settings.get("embedding_api_key") or self.settings.embedding_api_key) if self.user_settings else self.settings.embedding_api_key
         base_url = (self.user_settings.get("embedding_base_url") or self.settings.embedding_base_url or self.settings.llm_base_url) if self.user_settings else (self.settings.embedding_base_url or self.settings.llm_base_url)
         model = (self.user_settings.get("embedding_model") or self.settings.embedding_model) if self.user_settings else self.settings.embedding_model
 
-        # Direct HTTP request to OpenRouter for embeddings
-        async with httpx.AsyncClient(timeout=60.0, proxy=proxy_url) as client:
-            response = await client.post(
-                f"{base_url}/embeddings",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model,
-                    "input": text,
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        # Direct HTTP request to OpenRouter for embeddings (shared client)
+        client = get_http_client(self._get_proxy_url())
+        response = await client.post(
+            f"{base_url}/embeddings",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": model,
+                "input": text,
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            # OpenRouter format: { "data": [ { "embedding": [...] }, ... ] }
-            if "data" not in data:
-                raise ValueError(f"Unexpected response format: {data}")
+        # OpenRouter format: { "data": [ { "embedding": [...] }, ... ] }
+        if "data" not in data:
+            raise ValueError(f"Unexpected response format: {data}")
 
-            embeddings = [item["embedding"] for item in data["data"]]
+        embeddings = [item["embedding"] for item in data["data"]]
 
-            if not embeddings:
-                raise ValueError(f"No embeddings in response: {data}")
+        if not embeddings:
+            raise ValueError(f"No embeddings in response: {data}")
 
-            return embeddings[0]
+        return embeddings[0]
 
     def set_user_preference(self, key: str, value: Any) -> None:
         """Set a user preference for the session."""
@@ -264,28 +286,20 @@ async def list_projects(
     """
     if search:
         rows = await pool.fetch(
-            """SELECT p.id, p.name, p.description, p.created_at, p.updated_at,
-                      COUNT(DISTINCT d.id) as doc_count,
-                      COUNT(DISTINCT s.id) as session_count
-               FROM projects p
-               LEFT JOIN documents d ON d.project_id = p.id
-               LEFT JOIN chat_sessions s ON s.project_id = p.id
-               WHERE p.name ILIKE $1 OR p.description ILIKE $1
-               GROUP BY p.id
-               ORDER BY p.updated_at DESC
+            """SELECT id, name, description, created_at, updated_at,
+                      doc_count, session_count
+               FROM projects
+               WHERE name ILIKE $1 OR description ILIKE $1
+               ORDER BY updated_at DESC
                LIMIT $2""",
             f"%{search}%", limit
         )
     else:
         rows = await pool.fetch(
-            """SELECT p.id, p.name, p.description, p.created_at, p.updated_at,
-                      COUNT(DISTINCT d.id) as doc_count,
-                      COUNT(DISTINCT s.id) as session_count
-               FROM projects p
-               LEFT JOIN documents d ON d.project_id = p.id
-               LEFT JOIN chat_sessions s ON s.project_id = p.id
-               GROUP BY p.id
-               ORDER BY p.updated_at DESC
+            """SELECT id, name, description, created_at, updated_at,
+                      doc_count, session_count
+               FROM projects
+               ORDER BY updated_at DESC
                LIMIT $1""",
             limit
         )
@@ -433,9 +447,8 @@ async def list_sessions(
         List of session dicts
     """
     rows = await pool.fetch(
-        """SELECT id, project_id, title, created_at, updated_at,
-                  (SELECT COUNT(*) FROM chat_messages WHERE session_id = cs.id) as message_count
-           FROM chat_sessions cs
+        """SELECT id, project_id, title, created_at, updated_at, message_count
+           FROM chat_sessions
            WHERE project_id = $1
            ORDER BY updated_at DESC
            LIMIT $2""",
@@ -534,8 +547,6 @@ async def add_message(
     Returns:
         Message ID as string
     """
-    import json
-
     message_id = await pool.fetchval(
         """INSERT INTO chat_messages (session_id, role, content, metadata)
            VALUES ($1, $2, $3, $4::jsonb) RETURNING id""",
@@ -703,11 +714,16 @@ def calculate_file_hash(file_path: str) -> str:
     Returns:
         Hexadecimal hash string
     """
-    sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Hashing loop runs in C with the GIL released
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Python 3.10 has no hashlib.file_digest
+        sha256_hash = hashlib.sha256()
+        while chunk := f.read(1 << 20):
             sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+        return sha256_hash.hexdigest()
 
 
 # ============================================================================
@@ -729,7 +745,7 @@ async def get_document_chunk_count(
         Number of chunks
     """
     count = await pool.fetchval(
-        "SELECT COUNT(*) FROM chunks WHERE document_id = $1",
+        "SELECT chunk_count FROM documents WHERE id = $1",
         document_id
     )
     return count or 0
@@ -746,11 +762,17 @@ async def delete_document_chunks(pool: asyncpg.Pool, document_id: str) -> int:
     Returns:
         Number of chunks deleted
     """
-    result = await pool.execute(
-        "DELETE FROM chunks WHERE document_id = $1",
+    # Keep documents.chunk_count in step with the chunks table
+    deleted = await pool.fetchval(
+        """WITH deleted AS (
+               DELETE FROM chunks WHERE document_id = $1 RETURNING 1
+           ), reset AS (
+               UPDATE documents SET chunk_count = 0 WHERE id = $1
+           )
+           SELECT COUNT(*) FROM deleted""",
         document_id
     )
-    return int(result.split()[-1])
+    return deleted
 
 
 async def delete_document(pool: asyncpg.Pool, document_id: str) -> bool:
@@ -764,8 +786,11 @@ async def delete_document(pool: asyncpg.Pool, document_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    result = await pool.execute("DELETE FROM documents WHERE id = $1", document_id)
-    return "DELETE 1" in result
+    # Chunks, entities and relations go with it via ON DELETE CASCADE
+    deleted_id = await pool.fetchval(
+        "DELETE FROM documents WHERE id = $1 RETURNING id", document_id
+    )
+    return deleted_id is not None
 
 
 # ============================================================================
@@ -419,43 +419,31 @@ async def search_relations_by_entity(
     try:
         deps = ctx.deps
 
-        # Find documents with this entity
+        # Find relations between documents mentioning this entity in one query
         query = """
-            SELECT DISTINCT d.id
-            FROM entities e
-            JOIN documents d ON e.document_id = d.id
-            WHERE e.entity_name ILIKE $1
-            LIMIT 20
+            WITH entity_docs AS (
+                SELECT DISTINCT e.document_id AS id
+                FROM entities e
+                WHERE e.entity_name ILIKE $1
+                LIMIT 20
+            )
+            SELECT DISTINCT
+                r.relation_type,
+                r.confidence,
+                d1.title as source_title,
+                d2.title as target_title,
+                r.metadata->>'reasoning' as reasoning
+            FROM relations r
+            JOIN documents d1 ON r.source_document_id = d1.id
+            JOIN documents d2 ON r.target_document_id = d2.id
+            WHERE r.source_document_id IN (SELECT id FROM entity_docs)
+               OR r.target_document_id IN (SELECT id FROM entity_docs)
+            ORDER BY r.confidence DESC
+            LIMIT $2
         """
 
         async with deps.db_pool.acquire() as conn:
-            doc_rows = await conn.fetch(query, f"%{entity_name}%")
-
-            if not doc_rows:
-                return []
-
-            doc_ids = [row["id"] for row in doc_rows]
-
-            # Find relations between these documents (same connection)
-            # Using UNNEST with proper UUID array handling
-            doc_ids_str = ",".join([f"'{doc_id}'" for doc_id in doc_ids])
-            rel_query = f"""
-                SELECT DISTINCT
-                    r.relation_type,
-                    r.confidence,
-                    d1.title as source_title,
-                    d2.title as target_title,
-                    r.metadata->>'reasoning' as reasoning
-                FROM relations r
-                JOIN documents d1 ON r.source_document_id = d1.id
-                JOIN documents d2 ON r.target_document_id = d2.id
-                WHERE r.source_document_id::text = ANY(ARRAY[{doc_ids_str}]::text[])
-                   OR r.target_document_id::text = ANY(ARRAY[{doc_ids_str}]::text[])
-                ORDER BY r.confidence DESC
-                LIMIT {match_count}
-            """
-
-            results = await conn.fetch(rel_query)
+            results = await conn.fetch(query, f"%{entity_name}%", match_count)
 
             relations = [
                 {
@@ -16,13 +16,13 @@ Benefits over custom chunking:
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
-from transformers import AutoTokenizer
-from docling.chunking import HybridChunker
-from docling_core.types.doc import DoclingDocument
+
+if TYPE_CHECKING:
+    from docling_core.types.doc import DoclingDocument
 
 # Load environment variables
 load_dotenv()
@@ -30,6 +30,23 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def load_chunking_backend():
+    """
+    Import the tokenizer and chunker classes.
+
+    transformers and docling take seconds to import, so they are loaded on
+    first use (or by the web app at startup) instead of with this module.
+    Importing the ingestion pipeline, e.g. from the API routes, stays cheap.
+
+    Returns:
+        Tuple of (AutoTokenizer, HybridChunker) classes
+    """
+    from transformers import AutoTokenizer
+    from docling.chunking import HybridChunker
+
+    return AutoTokenizer, HybridChunker
+
+
 @dataclass
 class ChunkingConfig:
     """Configuration for DoclingHybridChunker."""
@@ -83,6 +100,8 @@ class DoclingHybridChunker:
         Args:
             config: Chunking configuration
         """
+        AutoTokenizer, HybridChunker = load_chunking_backend()
+
         self.config = config
 
         # Initialize tokenizer for token-aware chunking
@@ -105,7 +124,7 @@ class DoclingHybridChunker:
         title: str,
         source: str,
         metadata: Optional[Dict[str, Any]] = None,
-        docling_doc: Optional[DoclingDocument] = None
+        docling_doc: Optional["DoclingDocument"] = None
     ) -> List[DocumentChunk]:
         """
         Chunk a document using Docling's HybridChunker.
@@ -8,6 +8,7 @@ import os
 import asyncio
 import logging
 import glob
+import threading
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -21,12 +22,38 @@ from dotenv import load_dotenv
 from src.ingestion.chunker import ChunkingConfig, create_chunker, DocumentChunk
 from src.ingestion.embedder import create_embedder
 from src.settings import load_settings
+from src.dependencies import calculate_file_hash
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Resolution used when rasterizing PDF pages for OCR
+PDF_RENDER_DPI = 200
+
+# Lazy-loaded PaddleOCR engine (model load takes seconds, reuse across documents).
+# Documents are read in worker threads and the engine is not thread-safe, so
+# initialization and every ocr() call go through _paddle_ocr_lock.
+_paddle_ocr = None
+_paddle_ocr_lock = threading.Lock()
+
+# pdfium is not thread-safe, so every pdfium call (open/render/close) in
+# _paddle_ocr_pdf holds this lock.
+_pdfium_lock = threading.Lock()
+
+
+def _get_paddle_ocr():
+    """Lazy load PaddleOCR engine (Russian + Latin)."""
+    global _paddle_ocr
+    with _paddle_ocr_lock:
+        if _paddle_ocr is None:
+            from paddleocr import PaddleOCR
+
+            logger.info("Initializing PaddleOCR...")
+            _paddle_ocr = PaddleOCR(lang='ru')  # Russian + Latin
+    return _paddle_ocr
+
 
 @dataclass
 class IngestionConfig:
@@ -58,7 +85,8 @@ class DocumentIngestionPipeline:
         documents_folder: str = "documents",
         clean_before_ingest: bool = True,
         project_id: Optional[str] = None,
-        user_settings: Optional[Any] = None
+        user_settings: Optional[Any] = None,
+        db_pool: Optional[asyncpg.Pool] = None
     ):
         """Initialize ingestion pipeline."""
         self.config = config
@@ -70,8 +98,9 @@ class DocumentIngestionPipeline:
         # Load settings
         self.settings = load_settings()
 
-        # Initialize PostgreSQL pool
-        self.db_pool: Optional[asyncpg.Pool] = None
+        # PostgreSQL pool (a borrowed pool is left open by close())
+        self.db_pool: Optional[asyncpg.Pool] = db_pool
+        self._owns_db_pool = False
 
         # Initialize components
         self.chunker_config = ChunkingConfig(
@@ -93,23 +122,26 @@ class DocumentIngestionPipeline:
 
         logger.info("Initializing ingestion pipeline...")
 
-        self.db_pool = await asyncpg.create_pool(
-            self.settings.database_url,
-            min_size=2,
-            max_size=10
-        )
+        if not self.db_pool:
+            self.db_pool = await asyncpg.create_pool(
+                self.settings.database_url,
+                min_size=2,
+                max_size=10
+            )
+            self._owns_db_pool = True
+            logger.info(f"Connected to PostgreSQL: {self.settings.database_name}")
 
-        logger.info(f"Connected to PostgreSQL: {self.settings.database_name}")
         self._initialized = True
         logger.info("Ingestion pipeline initialized")
 
     async def close(self) -> None:
         """Close PostgreSQL connection pool."""
-        if self._initialized and self.db_pool:
+        if self._initialized and self._owns_db_pool:
             await self.db_pool.close()
             self.db_pool = None
-            self._initialized = False
+            self._owns_db_pool = False
             logger.info("PostgreSQL connection closed")
+        self._initialized = False
 
     def _find_document_files(self) -> List[str]:
         """Find all supported document files in the documents folder."""
@@ -265,63 +297,58 @@ class DocumentIngestionPipeline:
     def _paddle_ocr_pdf(self, file_path: str) -> tuple[str, Optional[Any]]:
         """Convert PDF to images and OCR with PaddleOCR for better multilingual text recognition."""
         try:
-            from paddleocr import PaddleOCR
-            from pdf2image import convert_from_path
+            import pypdfium2 as pdfium
             import numpy as np
 
             logger.info(f"Converting PDF to images for PaddleOCR: {os.path.basename(file_path)}")
 
-            # Initialize PaddleOCR (supports Russian + English)
-            # lang='ru' for Russian support
-            logger.info("Initializing PaddleOCR...")
-            ocr = PaddleOCR(lang='ru')  # Russian + Latin
+            ocr = _get_paddle_ocr()
 
-            # Process PDF page by page to save memory
-            from pdf2image.pdf2image import pdfinfo_from_path
-            info = pdfinfo_from_path(file_path)
-            page_count = info["Pages"]
+            # Render pages in-process with pdfium (ships with docling) instead of
+            # spawning a pdftoppm subprocess per page
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(file_path)
+                page_count = len(pdf)
             logger.info(f"PDF has {page_count} pages, processing page by page")
 
             all_text = []
 
-            for page_num in range(1, page_count + 1):
-                logger.info(f"Processing page {page_num} of {page_count}...")
-
-                # Convert one page at a time
-                images = convert_from_path(
-                    file_path,
-                    dpi=200,  # Good quality for OCR
-                    first_page=page_num,
-                    last_page=page_num
-                )
-
-                if not images:
-                    continue
-
-                # Convert PIL image to numpy array for PaddleOCR
-                img_array = np.array(images[0])
-
-                # Run OCR on this page
-                result = ocr.ocr(img_array, cls=True)
-
-                # Extract text from result
-                # PaddleOCR returns: [[[box], (text, confidence)], ...]
-                page_text_lines = []
-                if result and result[0]:
-                    for line in result[0]:
-                        if line and len(line) >= 2:
-                            text = line[1][0] if isinstance(line[1], tuple) else line[1]
-                            if text and text.strip():
-                                page_text_lines.append(text.strip())
-
-                if page_text_lines:
-                    page_text = "\n".join(page_text_lines)
-                    all_text.append(f"## Page {page_num}\n\n{page_text}")
-                    logger.info(f"Page {page_num}: extracted {len(page_text)} characters")
-
-                # Clear memory
-                del images
-                del img_array
+            try:
+                for page_num in range(1, page_count + 1):
+                    logger.info(f"Processing page {page_num} of {page_count}...")
+
+                    # Render one page at a time to save memory (200 DPI: good quality for OCR)
+                    with _pdfium_lock:
+                        page = pdf[page_num - 1]
+                        try:
+                            img_array = np.array(page.render(scale=PDF_RENDER_DPI / 72).to_pil())
+                        finally:
+                            page.close()
+
+                    # Run OCR on this page
+                    with _paddle_ocr_lock:
+                        result = ocr.ocr(img_array, cls=True)
+
+                    # Extract text from result
+                    # PaddleOCR returns: [[[box], (text, confidence)], ...]
+                    page_text_lines = []
+                    if result and result[0]:
+                        for line in result[0]:
+                            if line and len(line) >= 2:
+                                text = line[1][0] if isinstance(line[1], tuple) else line[1]
+                                if text and text.strip():
+                                    page_text_lines.append(text.strip())
+
+                    if page_text_lines:
+                        page_text = "\n".join(page_text_lines)
+                        all_text.append(f"## Page {page_num}\n\n{page_text}")
+                        logger.info(f"Page {page_num}: extracted {len(page_text)} characters")
+
+                    # Clear memory
+                    del img_array
+            finally:
+                with _pdfium_lock:
+                    pdf.close()
 
             if not all_text:
                 logger.warning(f"No text found in PDF {os.path.basename(file_path)}")
@@ -345,21 +372,20 @@ class DocumentIngestionPipeline:
     def _ocr_image(self, file_path: str) -> tuple[str, Optional[Any]]:
         """OCR image file using PaddleOCR."""
         try:
-            from paddleocr import PaddleOCR
             import numpy as np
             from PIL import Image
 
             logger.info(f"Performing PaddleOCR on image file: {os.path.basename(file_path)}")
 
-            # Initialize PaddleOCR
-            ocr = PaddleOCR(lang='ru')
+            ocr = _get_paddle_ocr()
 
             # Open and convert image to numpy array
             image = Image.open(file_path)
             img_array = np.array(image)
 
             # Run OCR
-            result = ocr.ocr(img_array, cls=True)
+            with _paddle_ocr_lock:
+                result = ocr.ocr(img_array, cls=True)
 
             # Extract text
             text_lines = []
@@ -436,12 +462,7 @@ class DocumentIngestionPipeline:
         Returns:
             Hexadecimal hash string
         """
-        import hashlib
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        return calculate_file_hash(file_path)
 
     async def _save_to_postgresql(
         self,
@@ -454,26 +475,35 @@ class DocumentIngestionPipeline:
     ) -> str:
         """Save document and chunks to PostgreSQL."""
         async with self.db_pool.acquire() as conn:
-            # Insert document with project support
+            # Insert document with project support. JSON is bound as text and
+            # cast in SQL, so it is stored correctly whether or not the pool
+            # (possibly the API's shared one) has a jsonb codec registered
             document_id = await conn.fetchval(
-                """INSERT INTO documents (title, source, uri, metadata, project_id, file_hash)
-                   VALUES ($1, $2, $3, $4::jsonb, $5, $6)
+                """INSERT INTO documents (title, source, uri, metadata, project_id, file_hash, chunk_count)
+                   VALUES ($1, $2, $3, $4::text::jsonb, $5, $6, $7)
                    RETURNING id""",
                 title, source, source, json.dumps(metadata),
-                self.project_id, file_hash
+                self.project_id, file_hash, len(chunks)
             )
 
             logger.info(f"Inserted document with ID: {document_id}")
 
-            # Insert chunks with embeddings
-            for chunk in chunks:
-                embedding_str = f"[{','.join(map(str, chunk.embedding))}]"
-                await conn.execute(
-                    """INSERT INTO chunks (document_id, content, embedding, chunk_index, token_count, metadata)
-                       VALUES ($1, $2, $3::vector, $4, $5, $6::jsonb)""",
-                    document_id, chunk.content, embedding_str, chunk.index,
-                    chunk.token_count, json.dumps(chunk.metadata)
-                )
+            # Insert chunks with embeddings in one batch
+            await conn.executemany(
+                """INSERT INTO chunks (document_id, content, embedding, chunk_index, token_count, metadata)
+                   VALUES ($1, $2, $3::vector, $4, $5, $6::text::jsonb)""",
+                [
+                    (
+                        document_id,
+                        chunk.content,
+                        f"[{','.join(map(str, chunk.embedding))}]",
+                        chunk.index,
+                        chunk.token_count,
+                        json.dumps(chunk.metadata)
+                    )
+                    for chunk in chunks
+                ]
+            )
 
             logger.info(f"Inserted {len(chunks)} chunks")
 
@@ -495,27 +525,27 @@ class DocumentIngestionPipeline:
 
             extractor = get_entity_extractor()
 
-            # Extract entities from full document content
-            doc_entities = extractor.extract_entities(content)
-
-            # Extract entities from each chunk and save
+            # Extract entities from each chunk (chunk_id can be NULL for document-level entities)
+            rows = []
             for chunk in chunks:
-                chunk_entities = extractor.extract_entities(chunk.content)
-
-                # Save entities for this chunk (chunk_id can be NULL for document-level entities)
-                for entity in chunk_entities:
+                for entity in extractor.extract_entities(chunk.content):
                     entity_dict = entity.to_dict()
-                    await conn.execute(
-                        """INSERT INTO entities (document_id, entity_type, entity_name, entity_text, metadata)
-                           VALUES ($1, $2, $3, $4, $5::jsonb)""",
+                    rows.append((
                         document_id,
                         entity_dict['entity_type'],
                         entity_dict['entity_name'][:1000],  # Limit name length
                         entity_dict['entity_text'][:5000],  # Limit text length
                         json.dumps(entity_dict.get('metadata', {}))
-                    )
+                    ))
+
+            if rows:
+                await conn.executemany(
+                    """INSERT INTO entities (document_id, entity_type, entity_name, entity_text, metadata)
+                       VALUES ($1, $2, $3, $4, $5::text::jsonb)""",
+                    rows
+                )
 
-            logger.info(f"Extracted and saved {sum(len(extractor.extract_entities(c.content)) for c in chunks)} entities from chunks")
+            logger.info(f"Extracted and saved {len(rows)} entities from chunks")
 
         except ImportError as e:
             logger.warning(f"Entity extraction not available: {e}")
@@ -555,15 +585,15 @@ class DocumentIngestionPipeline:
             await conn.execute("DELETE FROM documents")
             logger.info(f"Deleted {docs_count or 0} documents")
 
-    async def _ingest_single_document(self, file_path: str) -> IngestionResult:
-        """Ingest a single document."""
+    async def _ingest_single_document(self, file_path: str, source: Optional[str] = None) -> IngestionResult:
+        """Ingest a single document (source defaults to the path relative to documents_folder)."""
         start_time = datetime.now()
 
         # Calculate file hash for incremental ingestion
         file_hash = None
-        file_name = os.path.basename(file_path)
+        file_name = source or os.path.basename(file_path)
         if self.config.incremental:
-            file_hash = self._calculate_file_hash(file_path)
+            file_hash = await asyncio.to_thread(self._calculate_file_hash, file_path)
 
             # Check if document already exists
             async with self.db_pool.acquire() as conn:
@@ -591,9 +621,10 @@ class DocumentIngestionPipeline:
                         errors=[]
                     )
 
-        document_content, docling_doc = self._read_document(file_path)
+        # Conversion and OCR are blocking; keep them off the event loop
+        document_content, docling_doc = await asyncio.to_thread(self._read_document, file_path)
         document_title = self._extract_title(document_content, file_path)
-        document_source = os.path.relpath(file_path, self.documents_folder)
+        document_source = source or os.path.relpath(file_path, self.documents_folder)
 
         document_metadata = self._extract_document_metadata(document_content, file_path)
 
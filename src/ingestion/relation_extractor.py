@@ -4,8 +4,10 @@ Document relation extraction using Gemini 2.5 Flash Lite.
 Analyzes pairs of documents to determine relationships between them.
 """
 
+import asyncio
 import logging
 import json
+from itertools import islice
 from typing import List, Dict, Any, Optional, Tuple
 import httpx
 
@@ -187,50 +189,58 @@ class RelationExtractor:
     async def extract_relations_batch(
         self,
         documents: List[Dict[str, Any]],
-        max_pairs: int = 50
+        max_pairs: int = 50,
+        max_concurrency: int = 10
     ) -> List[Dict[str, Any]]:
         """
         Extract relations for multiple document pairs.
 
+        Pairs are analyzed concurrently, with at most max_concurrency
+        requests in flight to respect API rate limits.
+
         Args:
             documents: List of documents with id, title, and entities
             max_pairs: Maximum number of pairs to analyze
+            max_concurrency: Maximum number of concurrent LLM requests
 
         Returns:
             List of relations between documents
         """
-        relations = []
-        pairs_analyzed = 0
-
-        for i, doc1 in enumerate(documents):
-            for doc2 in documents[i+1:]:
-                if pairs_analyzed >= max_pairs:
-                    break
-
-                # Skip if no entities
-                if not doc1.get("entities") or not doc2.get("entities"):
-                    continue
-
-                relation = await self.extract_relation(
+        # Skip pairs where either document has no entities
+        pairs = list(islice(
+            (
+                (doc1, doc2)
+                for i, doc1 in enumerate(documents)
+                for doc2 in documents[i+1:]
+                if doc1.get("entities") and doc2.get("entities")
+            ),
+            max_pairs
+        ))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_pair(doc1: Dict[str, Any], doc2: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.extract_relation(
                     doc1["title"],
                     doc1["entities"],
                     doc2["title"],
                     doc2["entities"]
                 )
 
-                if relation and relation["relation_type"] != "NONE":
-                    relations.append({
-                        **relation,
-                        "source_doc_id": doc1["id"],
-                        "target_doc_id": doc2["id"]
-                    })
-
-                pairs_analyzed += 1
+        results = await asyncio.gather(*(analyze_pair(doc1, doc2) for doc1, doc2 in pairs))
 
-            if pairs_analyzed >= max_pairs:
-                break
+        relations = [
+            {
+                **relation,
+                "source_doc_id": doc1["id"],
+                "target_doc_id": doc2["id"]
+            }
+            for (doc1, doc2), relation in zip(pairs, results)
+            if relation and relation["relation_type"] != "NONE"
+        ]
 
-        logger.info(f"Analyzed {pairs_analyzed} pairs, found {len(relations)} relations")
+        logger.info(f"Analyzed {len(pairs)} pairs, found {len(relations)} relations")
         return relations
 
 
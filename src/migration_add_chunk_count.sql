@@ -0,0 +1,19 @@
+-- Migration: Store chunk count on documents
+-- Document listings used to count chunks with a correlated subquery per row;
+-- ingestion now records the count when it writes the chunks.
+-- Run this after migration_add_projects.sql
+
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS chunk_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill existing documents
+UPDATE documents d
+SET chunk_count = c.cnt
+FROM (
+    SELECT document_id, COUNT(*) AS cnt
+    FROM chunks
+    GROUP BY document_id
+) c
+WHERE c.document_id = d.id;
+
+-- Migration complete
+SELECT 'Migration completed successfully.' as message;
@@ -0,0 +1,13 @@
+-- Migration: Composite index for upload deduplication
+-- Uploads look documents up by (project_id, file_hash, source) to skip files
+-- that were already ingested; this turns the check into a single index probe.
+-- Run this after migration_add_projects.sql
+-- CONCURRENTLY builds without blocking ingestion; run outside a transaction block
+
+-- Not UNIQUE: existing databases may already hold duplicates from concurrent
+-- uploads, which would make a unique build fail
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_dedup
+    ON documents (project_id, file_hash, source);
+
+-- Migration complete
+SELECT 'Migration completed successfully.' as message;
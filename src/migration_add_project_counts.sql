@@ -0,0 +1,53 @@
+-- Migration: Trigger-maintained document/session counts on projects
+-- Project listings used to aggregate documents and chat_sessions with
+-- LEFT JOIN ... GROUP BY on every request; the counts are now kept on the
+-- project row and updated by triggers.
+-- Run this after migration_add_users.sql
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS doc_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS session_count INTEGER NOT NULL DEFAULT 0;
+
+-- Adjusts the counter column named by the trigger argument when a child row
+-- is added, removed or moved between projects
+CREATE OR REPLACE FUNCTION update_project_count()
+RETURNS TRIGGER AS $$
+DECLARE
+    counter TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.project_id IS NOT DISTINCT FROM NEW.project_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.project_id IS NOT NULL THEN
+        EXECUTE format('UPDATE projects SET %I = %I - 1 WHERE id = $1', counter, counter)
+        USING OLD.project_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.project_id IS NOT NULL THEN
+        EXECUTE format('UPDATE projects SET %I = %I + 1 WHERE id = $1', counter, counter)
+        USING NEW.project_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_project_doc_count ON documents;
+CREATE TRIGGER update_project_doc_count
+AFTER INSERT OR DELETE OR UPDATE OF project_id ON documents
+FOR EACH ROW
+EXECUTE FUNCTION update_project_count('doc_count');
+
+DROP TRIGGER IF EXISTS update_project_session_count ON chat_sessions;
+CREATE TRIGGER update_project_session_count
+AFTER INSERT OR DELETE OR UPDATE OF project_id ON chat_sessions
+FOR EACH ROW
+EXECUTE FUNCTION update_project_count('session_count');
+
+-- Backfill existing projects
+UPDATE projects p
+SET doc_count = (SELECT COUNT(*) FROM documents d WHERE d.project_id = p.id),
+    session_count = (SELECT COUNT(*) FROM chat_sessions s WHERE s.project_id = p.id);
+
+-- Migration complete
+SELECT 'Migration completed successfully.' as message;
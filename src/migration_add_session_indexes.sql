@@ -0,0 +1,23 @@
+-- Migration: Covering index for session lookups
+-- Every authenticated request looks up user_sessions by token_hash and reads
+-- user_id and expires_at; a covering index lets PostgreSQL answer that from
+-- the index alone (index-only scan) instead of visiting the heap.
+-- The UNIQUE constraint on token_hash is moved onto the covering index, so
+-- token_hash keeps a single B-tree.
+-- Run this after migration_add_users.sql. Databases created from the current
+-- migration_add_users.sql already have the covering constraint.
+-- CONCURRENTLY builds without blocking logins; run outside a transaction block
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS user_sessions_token_hash_covering
+    ON user_sessions (token_hash) INCLUDE (user_id, expires_at);
+
+-- Swap the constraint onto the new index; dropping it removes the old index
+ALTER TABLE user_sessions
+    DROP CONSTRAINT user_sessions_token_hash_key,
+    ADD CONSTRAINT user_sessions_token_hash_key UNIQUE USING INDEX user_sessions_token_hash_covering;
+
+-- The separate plain index duplicated the constraint's index
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_sessions_token_hash;
+
+-- Migration complete
+SELECT 'Migration completed successfully.' as message;
@@ -0,0 +1,43 @@
+-- Migration: Trigger-maintained message count on chat_sessions
+-- Session listings used a correlated COUNT(*) over chat_messages for every
+-- returned row; the count is now kept on the session row by a trigger.
+-- Run this after schema.sql
+
+ALTER TABLE chat_sessions ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION update_session_message_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE chat_sessions SET message_count = message_count + 1
+        WHERE id = NEW.session_id;
+    ELSE
+        UPDATE chat_sessions SET message_count = message_count - 1
+        WHERE id = OLD.session_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_session_message_count ON chat_messages;
+CREATE TRIGGER update_session_message_count
+AFTER INSERT OR DELETE ON chat_messages
+FOR EACH ROW
+EXECUTE FUNCTION update_session_message_count();
+
+-- Restrict the project timestamp trigger to title/project changes so the
+-- message_count updates above (and the backfill below) don't rewrite the
+-- project row and bump projects.updated_at on every chat message
+DROP TRIGGER IF EXISTS update_project_timestamp_on_session ON chat_sessions;
+CREATE TRIGGER update_project_timestamp_on_session
+AFTER INSERT OR UPDATE OF title, project_id ON chat_sessions
+FOR EACH ROW
+WHEN (NEW.project_id IS NOT NULL)
+EXECUTE FUNCTION update_project_timestamp();
+
+-- Backfill existing sessions
+UPDATE chat_sessions cs
+SET message_count = (SELECT COUNT(*) FROM chat_messages m WHERE m.session_id = cs.id);
+
+-- Migration complete
+SELECT 'Migration completed successfully.' as message;
@@ -6,6 +6,8 @@ CREATE TABLE IF NOT EXISTS projects (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     name TEXT NOT NULL UNIQUE,
     description TEXT,
+    doc_count INTEGER NOT NULL DEFAULT 0,      -- maintained by update_project_count trigger
+    session_count INTEGER NOT NULL DEFAULT 0,  -- maintained by update_project_count trigger
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -22,6 +24,7 @@ CREATE TABLE IF NOT EXISTS documents (
     first_ingested TIMESTAMPTZ DEFAULT NOW(),
     last_ingested TIMESTAMPTZ DEFAULT NOW(),
     ingestion_count INTEGER DEFAULT 1,
+    chunk_count INTEGER NOT NULL DEFAULT 0,  -- maintained by ingestion, avoids COUNT(*) over chunks
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -43,6 +46,7 @@ CREATE TABLE IF NOT EXISTS chat_sessions (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     project_id UUID REFERENCES projects(id) ON DELETE CASCADE,
     title TEXT NOT NULL DEFAULT 'New Chat',
+    message_count INTEGER NOT NULL DEFAULT 0,  -- maintained by update_session_message_count trigger
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -89,6 +93,7 @@ CREATE INDEX IF NOT EXISTS idx_chunks_content_gin ON chunks USING gin(to_tsvecto
 CREATE INDEX IF NOT EXISTS idx_documents_metadata ON documents USING gin(metadata);
 CREATE INDEX IF NOT EXISTS idx_documents_project_id ON documents(project_id);
 CREATE INDEX IF NOT EXISTS idx_documents_file_hash ON documents(file_hash);
+CREATE INDEX IF NOT EXISTS idx_documents_dedup ON documents(project_id, file_hash, source);
 CREATE INDEX IF NOT EXISTS idx_sessions_project_id ON chat_sessions(project_id);
 CREATE INDEX IF NOT EXISTS idx_messages_session_id ON chat_messages(session_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_entities_document_id ON entities(document_id);
@@ -274,8 +279,65 @@ FOR EACH ROW
 WHEN (NEW.project_id IS NOT NULL)
 EXECUTE FUNCTION update_project_timestamp();
 
+-- Only title/project changes count as project activity; message_count updates
+-- from update_session_message_count must not touch the project row
 CREATE TRIGGER update_project_timestamp_on_session
-AFTER INSERT OR UPDATE ON chat_sessions
+AFTER INSERT OR UPDATE OF title, project_id ON chat_sessions
 FOR EACH ROW
 WHEN (NEW.project_id IS NOT NULL)
 EXECUTE FUNCTION update_project_timestamp();
+
+-- Helper function to keep projects.doc_count / session_count current
+CREATE OR REPLACE FUNCTION update_project_count()
+RETURNS TRIGGER AS $$
+DECLARE
+    counter TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.project_id IS NOT DISTINCT FROM NEW.project_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.project_id IS NOT NULL THEN
+        EXECUTE format('UPDATE projects SET %I = %I - 1 WHERE id = $1', counter, counter)
+        USING OLD.project_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.project_id IS NOT NULL THEN
+        EXECUTE format('UPDATE projects SET %I = %I + 1 WHERE id = $1', counter, counter)
+        USING NEW.project_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Triggers to maintain project counters
+CREATE TRIGGER update_project_doc_count
+AFTER INSERT OR DELETE OR UPDATE OF project_id ON documents
+FOR EACH ROW
+EXECUTE FUNCTION update_project_count('doc_count');
+
+CREATE TRIGGER update_project_session_count
+AFTER INSERT OR DELETE OR UPDATE OF project_id ON chat_sessions
+FOR EACH ROW
+EXECUTE FUNCTION update_project_count('session_count');
+
+-- Helper function to keep chat_sessions.message_count current
+CREATE OR REPLACE FUNCTION update_session_message_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE chat_sessions SET message_count = message_count + 1
+        WHERE id = NEW.session_id;
+    ELSE
+        UPDATE chat_sessions SET message_count = message_count - 1
+        WHERE id = OLD.session_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER update_session_message_count
+AFTER INSERT OR DELETE ON chat_messages
+FOR EACH ROW
+EXECUTE FUNCTION update_session_message_count();
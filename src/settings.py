@@ -19,6 +19,12 @@ class Settings(BaseSettings):
     # PostgreSQL Configuration
     database_url: str = Field(..., description="PostgreSQL connection string")
     database_name: str = Field(default="rag_kb", description="Database name")
+    db_pool_size: Optional[int] = Field(
+        default=None, ge=1, description="Connections kept in the API database pool (default: 2 * CPU cores + 1)"
+    )
+    bulk_insert_batch_size: int = Field(
+        default=1000, ge=1, description="Rows per INSERT statement for bulk create endpoints"
+    )
 
     # LLM Configuration (OpenAI-compatible)
     llm_provider: str = Field(
@@ -87,6 +93,12 @@ class Settings(BaseSettings):
         default=0.3, description="Default text weight for hybrid search (0-1)"
     )
 
+    # Upload Configuration
+    upload_tmp_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for staging uploads, e.g. a tmpfs such as /dev/shm (default: system temp dir)",
+    )
+
 
 def load_settings() -> Settings:
     """Load settings with proper error handling."""
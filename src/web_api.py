@@ -1,7 +1,8 @@
 """FastAPI application for PostgreSQL RAG Agent."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -10,6 +11,9 @@ from pathlib import Path
 
 from src.api.routes import projects, sessions, messages, documents, chat, settings, auth, jobs
 from src.api.models.responses import HealthResponse
+from src.api.dependencies import get_settings, init_db_pool, close_db_pool, UPLOADS_DIR
+from src.dependencies import close_http_clients
+from src.ingestion.chunker import load_chunking_backend
 from src.settings import Settings, load_settings
 import asyncpg
 
@@ -25,6 +29,28 @@ logger = logging.getLogger(__name__)
 # LIFESPAN CONTEXT MANAGER
 # ============================================================================
 
+# Expired sessions are purged in the background so the session index stays small
+SESSION_SWEEP_INTERVAL_SECONDS = 3600
+
+
+async def sweep_expired_sessions(pool: asyncpg.Pool) -> None:
+    """
+    Periodically delete expired user sessions.
+
+    Args:
+        pool: Database connection pool
+    """
+    while True:
+        try:
+            deleted = await pool.fetchval("SELECT cleanup_expired_sessions()")
+            if deleted:
+                logger.info(f"Removed {deleted} expired sessions")
+        except Exception as e:
+            logger.warning(f"Expired session cleanup failed: {e}")
+
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -37,13 +63,18 @@ async def lifespan(app: FastAPI):
         settings = load_settings()
         logger.info(f"Loaded settings: database={settings.database_name}")
 
-        # Test database connection
-        pool = await asyncpg.create_pool(settings.database_url, min_size=1, max_size=5)
-        async with pool.acquire() as conn:
-            await conn.fetchval("SELECT 1")
-        await pool.close()
+        # Create the shared database pool and test the connection
+        pool = await init_db_pool(settings)
+        await pool.fetchval("SELECT 1")
         logger.info("Database connection successful")
 
+        UPLOADS_DIR.mkdir(exist_ok=True)
+
+        # Load transformers/docling now rather than on the first upload
+        await asyncio.to_thread(load_chunking_backend)
+
+        session_sweeper = asyncio.create_task(sweep_expired_sessions(pool))
+
     except Exception as e:
         logger.error(f"Startup error: {e}")
         raise
@@ -52,6 +83,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down FastAPI application")
+    session_sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await session_sweeper
+    await jobs.close_job_listener()
+    await close_db_pool()
+    await close_http_clients()
 
 
 # ============================================================================
@@ -123,15 +160,11 @@ async def health_check() -> HealthResponse:
     Returns:
         HealthResponse: Service status
     """
-    settings = load_settings()
-
     # Check database connection
     db_connected = False
     try:
-        pool = await asyncpg.create_pool(settings.database_url, min_size=1, max_size=5)
-        async with pool.acquire() as conn:
-            await conn.fetchval("SELECT 1")
-        await pool.close()
+        pool = await init_db_pool(await get_settings())
+        await pool.fetchval("SELECT 1")
         db_connected = True
     except Exception as e:
         logger.warning(f"Database health check failed: {e}")
@@ -0,0 +1,36 @@
+"""Shared fixtures for route tests."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.api.models.auth import User
+
+
+class FakePool:
+    """Pool that records every query and answers fetchrow with the given rows in turn.
+
+    The last row keeps being returned once the others are used up.
+    """
+
+    def __init__(self, *rows):
+        self.rows = list(rows) or [None]
+        self.queries = []
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows.pop(0) if len(self.rows) > 1 else self.rows[0]
+
+
+@pytest.fixture
+def make_pool():
+    """Build a FakePool answering with the given rows."""
+    return FakePool
+
+
+@pytest.fixture
+def user() -> User:
+    """Authenticated user the routes run as."""
+    now = datetime.now(timezone.utc)
+    return User(id=str(uuid4()), username="alice", created_at=now, updated_at=now)
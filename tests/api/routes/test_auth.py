@@ -0,0 +1,36 @@
+"""Tests for settings SQL generation in src.api.routes.auth."""
+
+import pytest
+
+from src.api.routes.auth import _build_settings_update_sql
+
+
+@pytest.mark.unit
+def test_update_sql_binds_fields_in_order():
+    """Field values bind as $1..$n and the user ID as the last parameter."""
+    sql = _build_settings_update_sql(("llm_model", "llm_provider"))
+
+    assert "llm_model = $1" in sql
+    assert "llm_provider = $2" in sql
+    assert "WHERE user_id = $3" in sql
+    assert "RETURNING" in sql
+
+
+@pytest.mark.unit
+def test_update_sql_is_cached_per_field_set():
+    """The same field set reuses identical SQL text."""
+    fields = ("llm_api_key",)
+
+    assert _build_settings_update_sql(fields) is _build_settings_update_sql(fields)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("fields", [
+    ("user_id",),
+    ("llm_model", "updated_at"),
+    ("llm_model = 'x', user_id",),
+])
+def test_update_sql_rejects_unknown_fields(fields):
+    """Only UserSettingsUpdate fields may be interpolated into the statement."""
+    with pytest.raises(ValueError, match="Unknown settings fields"):
+        _build_settings_update_sql(fields)
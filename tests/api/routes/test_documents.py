@@ -0,0 +1,156 @@
+"""Tests for batch upload processing in src.api.routes.documents."""
+
+import asyncio
+import hashlib
+import io
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, UploadFile, status
+
+from src.api.routes.documents import (
+    _process_upload,
+    process_file_background,
+    upload_files_async,
+    upload_staging_path,
+)
+
+
+class FakePool:
+    """Pool with no previously ingested documents."""
+
+    async def fetchrow(self, query, *args):
+        return None
+
+    async def execute(self, query, *args):
+        return "UPDATE 0"
+
+
+class FakeUploadPool:
+    """Pool for async uploads: owns the project if asked, knows the given documents."""
+
+    def __init__(self, project_exists=True, documents=()):
+        self.project_exists = project_exists
+        self.documents = list(documents)
+
+    async def fetchval(self, query, *args):
+        return uuid4() if self.project_exists else None
+
+    async def fetch(self, query, *args):
+        return [{"source": source, "file_hash": file_hash} for source, file_hash in self.documents]
+
+    async def fetchrow(self, query, *args):
+        # The background job finds its file already ingested
+        return {"id": uuid4()} if "FROM documents" in query else None
+
+    async def execute(self, query, *args):
+        return "UPDATE 1"
+
+
+class FakePipeline:
+    """Records what would have been ingested for each file."""
+
+    def __init__(self):
+        self.ingested = []
+
+    async def _ingest_single_document(self, file_path, source=None):
+        # Yield so other files in the batch are staged in the meantime
+        await asyncio.sleep(0)
+        with open(file_path, "rb") as f:
+            self.ingested.append((source, f.read()))
+        return SimpleNamespace(errors=[], chunks_created=1)
+
+
+def upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename, size=len(content))
+
+
+async def upload_async(files, pool, user, staging_dir):
+    settings = SimpleNamespace(upload_tmp_dir=str(staging_dir))
+    return await upload_files_async(uuid4(), files, pool, user, settings)
+
+
+async def process_batch(files, temp_dir, pipeline):
+    semaphore = asyncio.Semaphore(4)
+    batch_keys = set()
+    return await asyncio.gather(*(
+        _process_upload(file, index, str(temp_dir), "project", FakePool(), pipeline, semaphore, batch_keys)
+        for index, file in enumerate(files)
+    ))
+
+
+@pytest.mark.unit
+async def test_same_name_different_content_are_both_ingested(tmp_path):
+    """Same-named files in one batch are staged separately and keep their content."""
+    pipeline = FakePipeline()
+
+    results = await process_batch(
+        [upload("report.txt", b"first"), upload("report.txt", b"second")], tmp_path, pipeline
+    )
+
+    assert [result.status for result in results] == ["processed", "processed"]
+    assert sorted(pipeline.ingested) == [("report.txt", b"first"), ("report.txt", b"second")]
+
+
+@pytest.mark.unit
+async def test_identical_files_in_batch_are_ingested_once(tmp_path):
+    """A file repeated within one batch is ingested only once."""
+    pipeline = FakePipeline()
+
+    results = await process_batch(
+        [upload("report.txt", b"same"), upload("report.txt", b"same")], tmp_path, pipeline
+    )
+
+    assert pipeline.ingested == [("report.txt", b"same")]
+    assert sorted(result.status for result in results) == [
+        "processed", "skipped (duplicate in batch)"
+    ]
+    assert all(result.success for result in results)
+
+
+@pytest.mark.unit
+async def test_same_content_different_names_are_both_ingested(tmp_path):
+    """Deduplication is keyed by filename and content together."""
+    pipeline = FakePipeline()
+
+    await process_batch([upload("a.txt", b"same"), upload("b.txt", b"same")], tmp_path, pipeline)
+
+    assert sorted(pipeline.ingested) == [("a.txt", b"same"), ("b.txt", b"same")]
+
+
+@pytest.mark.unit
+async def test_async_upload_to_unknown_project_leaves_no_staging_dir(tmp_path, user):
+    """A 404 for the project removes the batch's staging directory."""
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_async([upload("a.txt", b"a")], FakeUploadPool(project_exists=False), user, tmp_path)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+async def test_async_upload_of_duplicates_leaves_no_staging_dir(tmp_path, user):
+    """Files rejected as duplicates are removed along with their directories."""
+    pool = FakeUploadPool(documents=[("a.txt", hashlib.sha256(b"a").hexdigest())])
+
+    statuses = await upload_async([upload("a.txt", b"a")], pool, user, tmp_path)
+
+    assert [job.status for job in statuses] == ["failed"]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+async def test_background_job_removes_its_staging_dirs(tmp_path):
+    """The last background job of a batch removes the batch directory too."""
+    batch_dir = tmp_path / "batch"
+    first, second = (upload_staging_path(str(batch_dir), index, "a.txt") for index in range(2))
+    for path in (first, second):
+        with open(path, "wb") as f:
+            f.write(b"a")
+
+    await process_file_background(FakeUploadPool(), str(uuid4()), first, "a.txt", str(uuid4()), "user")
+    assert sorted(p.name for p in batch_dir.iterdir()) == ["1"]
+
+    await process_file_background(FakeUploadPool(), str(uuid4()), second, "a.txt", str(uuid4()), "user")
+    assert not batch_dir.exists()
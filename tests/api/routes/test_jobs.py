@@ -0,0 +1,160 @@
+"""Tests for the job event stream in src.api.routes.jobs."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.api.models.auth import User
+from src.api.routes import jobs
+from src.api.routes.jobs import stream_job_events
+from src.api.utils import JOB_UPDATES_CHANNEL
+
+
+class FakeListener:
+    """LISTEN connection that delivers notifications on demand."""
+
+    def __init__(self):
+        self.closed = False
+        self.callbacks = {}
+        self.termination_callbacks = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def add_listener(self, channel, callback):
+        self.callbacks[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.termination_callbacks.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_callbacks.remove(callback)
+
+    async def close(self):
+        self.closed = True
+
+    def notify(self, payload: dict) -> None:
+        self.callbacks[JOB_UPDATES_CHANNEL](self, 1, JOB_UPDATES_CHANNEL, json.dumps(payload))
+
+
+@pytest.fixture
+def listeners(monkeypatch):
+    """Replace asyncpg.connect for the job listener and reset its state."""
+    opened = []
+
+    async def connect(dsn):
+        opened.append(FakeListener())
+        return opened[-1]
+
+    monkeypatch.setattr(jobs.asyncpg, "connect", connect)
+    yield opened
+    jobs._job_listener = None
+    jobs._job_subscribers.clear()
+
+
+def job_row(job_id: str, job_status: str) -> dict:
+    return {
+        "id": job_id,
+        "filename": "report.pdf",
+        "status": job_status,
+        "progress": 100 if job_status == "completed" else 0,
+        "chunks_created": 0,
+        "error_message": None,
+    }
+
+
+def job_update(job_id: str, job_status: str) -> dict:
+    row = job_row(job_id, job_status)
+    return {"job_id": row.pop("id"), **row}
+
+
+def event_status(event: bytes) -> str:
+    assert event.startswith(b"event: job\ndata: ")
+    return json.loads(event.split(b"data: ", 1)[1])["status"]
+
+
+async def open_stream(job_id: str, pool, user: User):
+    settings = SimpleNamespace(database_url="postgresql://test")
+    response = await stream_job_events(job_id, pool, user, settings)
+    return response.body_iterator
+
+
+@pytest.mark.unit
+async def test_stream_sends_current_status_then_notified_updates(listeners, make_pool, user):
+    """The stream starts with the stored status and ends at a terminal update."""
+    job_id = str(uuid4())
+    events = await open_stream(job_id, make_pool(job_row(job_id, "pending")), user)
+
+    assert event_status(await anext(events)) == "pending"
+
+    listeners[0].notify(job_update(job_id, "processing"))
+    assert event_status(await anext(events)) == "processing"
+
+    listeners[0].notify(job_update(job_id, "completed"))
+    assert event_status(await anext(events)) == "completed"
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(events)
+    assert not jobs._job_subscribers
+
+
+@pytest.mark.unit
+async def test_stream_ignores_other_jobs_and_malformed_payloads(listeners, make_pool, user):
+    """Only notifications for the streamed job reach it."""
+    job_id = str(uuid4())
+    events = await open_stream(job_id, make_pool(job_row(job_id, "pending")), user)
+    await anext(events)
+
+    listeners[0].notify(job_update(str(uuid4()), "completed"))
+    listeners[0].callbacks[JOB_UPDATES_CHANNEL](listeners[0], 1, JOB_UPDATES_CHANNEL, "not json")
+    listeners[0].notify(job_update(job_id, "failed"))
+
+    assert event_status(await anext(events)) == "failed"
+    await events.aclose()
+
+
+@pytest.mark.unit
+async def test_stream_for_unknown_job_is_not_found(listeners, make_pool, user):
+    """A job the user can't see is a 404 and leaves no subscription behind."""
+    with pytest.raises(HTTPException) as exc_info:
+        await open_stream(str(uuid4()), make_pool(None), user)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert not jobs._job_subscribers
+
+
+@pytest.mark.unit
+async def test_lost_listener_reconnects_while_streams_wait(listeners, make_pool, user):
+    """A dropped LISTEN connection is replaced and keeps feeding open streams."""
+    job_id = str(uuid4())
+    events = await open_stream(job_id, make_pool(job_row(job_id, "pending")), user)
+    await anext(events)
+
+    lost = listeners[0]
+    lost.closed = True
+    for callback in lost.termination_callbacks:
+        callback(lost)
+    await asyncio.sleep(0)
+
+    assert len(listeners) == 2
+    listeners[1].notify(job_update(job_id, "completed"))
+    assert event_status(await anext(events)) == "completed"
+
+
+@pytest.mark.unit
+async def test_keepalive_catches_up_from_job_row(listeners, make_pool, user, monkeypatch):
+    """Updates missed while the listener was down are read back from the job row."""
+    monkeypatch.setattr(jobs, "JOB_EVENTS_KEEPALIVE_SECONDS", 0.01)
+    job_id = str(uuid4())
+    pool = make_pool(job_row(job_id, "pending"), job_row(job_id, "pending"), job_row(job_id, "completed"))
+    events = await open_stream(job_id, pool, user)
+
+    assert event_status(await anext(events)) == "pending"
+    assert await anext(events) == b": keepalive\n\n"
+    assert event_status(await anext(events)) == "completed"
+    with pytest.raises(StopAsyncIteration):
+        await anext(events)
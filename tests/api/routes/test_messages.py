@@ -0,0 +1,45 @@
+"""Tests for chat message routes in src.api.routes.messages."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.api.models.requests import MessageCreate
+from src.api.routes.messages import add_message
+
+
+@pytest.mark.unit
+async def test_add_message_returns_inserted_row_from_one_query(make_pool):
+    """The message is built from the INSERT's RETURNING row, with no follow-up SELECT."""
+    session_id = uuid4()
+    pool = make_pool({
+        "id": uuid4(),
+        "session_id": session_id,
+        "role": "user",
+        "content": "hello",
+        "metadata": {"source": "test"},
+        "created_at": datetime.now(timezone.utc),
+    })
+
+    message = await add_message(
+        session_id, MessageCreate(role="user", content="hello", metadata={"source": "test"}), pool
+    )
+
+    assert len(pool.queries) == 1
+    assert pool.queries[0][0].lstrip().startswith("INSERT INTO chat_messages")
+    assert message.session_id == str(session_id)
+    assert message.metadata == {"source": "test"}
+
+
+@pytest.mark.unit
+async def test_add_message_to_missing_session_is_not_found(make_pool):
+    """The session check is part of the INSERT; no row means no session."""
+    pool = make_pool(None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await add_message(uuid4(), MessageCreate(role="user", content="hello"), pool)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert len(pool.queries) == 1
@@ -0,0 +1,156 @@
+"""Tests for project routes in src.api.routes.projects."""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import asyncpg
+import pytest
+from fastapi import HTTPException, status
+
+from src.api.models.requests import ProjectCreate, ProjectUpdate
+from src.api.routes.projects import UPDATE_PROJECT_SQL, create_projects_bulk, get_project, update_project
+
+
+class FakeTransaction:
+    """Transaction context that records whether it was used."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.in_transaction = True
+
+    async def __aexit__(self, *exc):
+        self.conn.in_transaction = False
+
+
+class FakeConnection:
+    """Connection that turns each bulk INSERT into project rows."""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.in_transaction = False
+        self.batches = []
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    async def fetch(self, query, names, descriptions, user_id):
+        assert self.in_transaction
+        if self.error is not None:
+            raise self.error
+        self.batches.append(names)
+        return [project_row(name=name, description=description) for name, description in zip(names, descriptions)]
+
+
+class FakeAcquire:
+    """Async context manager returned by FakeBulkPool.acquire()."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeBulkPool:
+    """Pool that hands out a single FakeConnection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        return FakeAcquire(self.conn)
+
+
+def project_row(**overrides) -> dict:
+    now = datetime.now(timezone.utc)
+    row = {
+        "id": uuid4(),
+        "name": "project",
+        "description": None,
+        "created_at": now,
+        "updated_at": now,
+        "doc_count": 3,
+        "session_count": 2,
+    }
+    row.update(overrides)
+    return row
+
+
+
+@pytest.mark.unit
+async def test_get_project_reads_stored_counts(make_pool, user):
+    """Counts come from the project row in one query, not from aggregating children."""
+    pool = make_pool(project_row())
+
+    project = await get_project(uuid4(), pool, user)
+
+    assert (project.doc_count, project.session_count) == (3, 2)
+    assert len(pool.queries) == 1
+    query = pool.queries[0][0].upper()
+    assert "COUNT(" not in query and "JOIN" not in query
+
+
+@pytest.mark.unit
+def test_update_sql_covers_every_field_combination():
+    """Every non-empty combination of updatable fields has a prepared statement."""
+    assert set(UPDATE_PROJECT_SQL) == {("name",), ("description",), ("name", "description")}
+
+    sql = UPDATE_PROJECT_SQL[("name", "description")]
+    assert "name = $1" in sql
+    assert "description = $2" in sql
+    assert "WHERE id = $3 AND user_id = $4" in sql
+
+
+@pytest.mark.unit
+async def test_update_project_uses_precomputed_statement(make_pool, user):
+    """Updates reuse the statement text built at import time."""
+    pool = make_pool(project_row(description="new"))
+    project_id = uuid4()
+
+    project = await update_project(project_id, ProjectUpdate(description="new"), pool, user)
+
+    query, args = pool.queries[0]
+    assert query is UPDATE_PROJECT_SQL[("description",)]
+    assert args == ("new", project_id, user.id)
+    assert project.description == "new"
+
+
+@pytest.mark.unit
+async def test_bulk_create_inserts_in_batches_within_one_transaction(user):
+    """Projects are inserted batch_size rows per statement inside one transaction."""
+    conn = FakeConnection()
+    names = [f"project {i}" for i in range(5)]
+
+    response = await create_projects_bulk(
+        [ProjectCreate(name=name) for name in names],
+        FakeBulkPool(conn),
+        user,
+        SimpleNamespace(bulk_insert_batch_size=2)
+    )
+
+    assert [len(batch) for batch in conn.batches] == [2, 2, 1]
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [project["name"] for project in json.loads(response.body)] == names
+
+
+@pytest.mark.unit
+async def test_bulk_create_conflict_on_duplicate_name(user):
+    """A duplicate name anywhere in the batch fails the request with 409."""
+    conn = FakeConnection(error=asyncpg.UniqueViolationError("duplicate key"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await create_projects_bulk(
+            [ProjectCreate(name="a"), ProjectCreate(name="a")],
+            FakeBulkPool(conn),
+            user,
+            SimpleNamespace(bulk_insert_batch_size=100)
+        )
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
@@ -0,0 +1,46 @@
+"""Tests for chat session routes in src.api.routes.sessions."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.api.models.requests import SessionCreate
+from src.api.routes.sessions import create_session
+
+
+@pytest.mark.unit
+async def test_create_session_is_one_ownership_checked_insert(make_pool, user):
+    """The ownership check and the INSERT run as a single statement."""
+    project_id = uuid4()
+    now = datetime.now(timezone.utc)
+    pool = make_pool({
+        "id": uuid4(),
+        "project_id": project_id,
+        "title": "Research",
+        "created_at": now,
+        "updated_at": now,
+        "message_count": 0,
+    })
+
+    session = await create_session(project_id, SessionCreate(title="Research"), pool, user)
+
+    assert session.title == "Research"
+    assert len(pool.queries) == 1
+    query, args = pool.queries[0]
+    assert query.lstrip().startswith("INSERT INTO chat_sessions")
+    assert "user_id = $2" in query
+    assert args == (project_id, user.id, "Research")
+
+
+@pytest.mark.unit
+async def test_create_session_in_foreign_project_is_not_found(make_pool, user):
+    """Nothing is inserted for a project the user doesn't own."""
+    pool = make_pool(None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await create_session(uuid4(), SessionCreate(), pool, user)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert len(pool.queries) == 1
@@ -0,0 +1,140 @@
+"""Tests for the session lookup cache in src.api.dependencies."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api import dependencies
+from src.api.dependencies import invalidate_session, lookup_session_user
+
+
+class FakePool:
+    """Minimal pool that answers the session lookup query."""
+
+    def __init__(self, row=None, release: asyncio.Event = None):
+        self.row = row
+        self.release = release
+        self.calls = 0
+
+    async def fetchrow(self, query, *args):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return self.row
+
+
+def session_row(expires_in: float = 3600.0) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "username": "alice",
+        "created_at": now,
+        "updated_at": now,
+        "expires_in": expires_in,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    dependencies._session_cache.clear()
+    dependencies._session_lookups.clear()
+    yield
+    dependencies._session_cache.clear()
+    dependencies._session_lookups.clear()
+
+
+@pytest.mark.unit
+async def test_cached_session_skips_query():
+    """A validated session is served from the cache on the next lookup."""
+    pool = FakePool(session_row())
+
+    first = await lookup_session_user(pool, "token")
+    second = await lookup_session_user(pool, "token")
+
+    assert first.username == "alice"
+    assert second is first
+    assert pool.calls == 1
+
+
+@pytest.mark.unit
+async def test_expired_cache_entry_is_refetched():
+    """Entries past their TTL are dropped and the session is queried again."""
+    pool = FakePool(session_row())
+    user = await lookup_session_user(pool, "token")
+
+    dependencies._session_cache["token"] = (user, time.monotonic() - 1)
+    await lookup_session_user(pool, "token")
+
+    assert pool.calls == 2
+
+
+@pytest.mark.unit
+async def test_cache_ttl_never_outlives_session():
+    """A session about to expire is cached only until its expiry."""
+    pool = FakePool(session_row(expires_in=2.0))
+
+    await lookup_session_user(pool, "token")
+
+    _, valid_until = dependencies._session_cache["token"]
+    assert valid_until - time.monotonic() <= 2.0
+    assert dependencies.SESSION_CACHE_TTL_SECONDS > 2.0
+
+
+@pytest.mark.unit
+async def test_invalid_session_is_not_cached():
+    """Unknown or expired tokens resolve to None and are looked up each time."""
+    pool = FakePool(None)
+
+    assert await lookup_session_user(pool, "token") is None
+    assert await lookup_session_user(pool, "token") is None
+    assert pool.calls == 2
+    assert "token" not in dependencies._session_cache
+
+
+@pytest.mark.unit
+async def test_concurrent_lookups_share_one_query():
+    """Concurrent lookups of the same token coalesce into a single query."""
+    release = asyncio.Event()
+    pool = FakePool(session_row(), release=release)
+
+    lookups = asyncio.gather(*(lookup_session_user(pool, "token") for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    users = await lookups
+    await asyncio.sleep(0)
+
+    assert pool.calls == 1
+    assert all(user is users[0] for user in users)
+    assert not dependencies._session_lookups
+
+
+@pytest.mark.unit
+async def test_invalidate_session_evicts_cache():
+    """Logout evicts the cached session so the next lookup hits the database."""
+    pool = FakePool(session_row())
+    await lookup_session_user(pool, "token")
+
+    invalidate_session("token")
+    await lookup_session_user(pool, "token")
+
+    assert pool.calls == 2
+
+
+@pytest.mark.unit
+async def test_logout_during_lookup_does_not_recache_session():
+    """A lookup that started before logout finishes without caching the session."""
+    release = asyncio.Event()
+    pool = FakePool(session_row(), release=release)
+
+    lookup = asyncio.create_task(lookup_session_user(pool, "token"))
+    await asyncio.sleep(0)
+    invalidate_session("token")
+    release.set()
+    await lookup
+
+    assert "token" not in dependencies._session_cache
+    pool.release = None
+    await lookup_session_user(pool, "token")
+    assert pool.calls == 2
@@ -0,0 +1,69 @@
+"""Tests for shared API helpers in src.api.utils."""
+
+import pytest
+from fastapi import Request, status
+
+from src.api.utils import etag_headers, make_etag, not_modified
+
+
+def make_request(if_none_match: str = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.unit
+def test_make_etag_is_weak_and_deterministic():
+    """The same version parts always produce the same weak ETag."""
+    etag = make_etag("project", 100, 3)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == make_etag("project", 100, 3)
+
+
+@pytest.mark.unit
+def test_make_etag_changes_with_any_part():
+    """Changing any version part changes the ETag."""
+    assert make_etag("project", 100, 3) != make_etag("project", 100, 4)
+    assert make_etag("project", 100, 3) != make_etag("project", 50, 3)
+
+
+@pytest.mark.unit
+def test_not_modified_on_matching_etag():
+    """A matching If-None-Match yields a body-less 304 carrying the ETag."""
+    etag = make_etag("doc", 1)
+
+    response = not_modified(make_request(etag), etag)
+
+    assert response is not None
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.body == b""
+
+
+@pytest.mark.unit
+def test_not_modified_matches_any_listed_etag():
+    """If-None-Match may list several ETags."""
+    etag = make_etag("doc", 1)
+
+    response = not_modified(make_request(f'W/"other", {etag}'), etag)
+
+    assert response is not None
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("header", [None, "", 'W/"stale"'])
+def test_not_modified_returns_none_when_resource_changed(header):
+    """Missing or stale If-None-Match means the resource must be sent."""
+    assert not_modified(make_request(header), make_etag("doc", 2)) is None
+
+
+@pytest.mark.unit
+def test_etag_headers_require_revalidation():
+    """Cached responses must be revalidated with the ETag."""
+    headers = etag_headers('W/"abc"')
+
+    assert headers["ETag"] == 'W/"abc"'
+    assert headers["Cache-Control"] == "private, no-cache"
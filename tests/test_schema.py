@@ -0,0 +1,90 @@
+"""Tests for the trigger-maintained counters in src/schema.sql."""
+
+import pytest
+
+
+async def create_project(db, name: str = "project"):
+    return await db.fetchval("INSERT INTO projects (name) VALUES ($1) RETURNING id", name)
+
+
+async def create_session(db, project_id):
+    return await db.fetchval(
+        "INSERT INTO chat_sessions (project_id) VALUES ($1) RETURNING id", project_id
+    )
+
+
+async def add_message(db, session_id):
+    return await db.fetchval(
+        """INSERT INTO chat_messages (session_id, role, content)
+           VALUES ($1, 'user', 'hello') RETURNING id""",
+        session_id
+    )
+
+
+async def project_counts(db, project_id):
+    return tuple(await db.fetchrow(
+        "SELECT doc_count, session_count FROM projects WHERE id = $1", project_id
+    ))
+
+
+@pytest.mark.integration
+async def test_project_counts_follow_documents_and_sessions(db):
+    """Inserting and deleting documents and sessions adjusts the project's counts."""
+    project_id = await create_project(db)
+
+    document_ids = [
+        await db.fetchval(
+            "INSERT INTO documents (title, source, project_id) VALUES ($1, $1, $2) RETURNING id",
+            title, project_id
+        )
+        for title in ("a.txt", "b.txt")
+    ]
+    await create_session(db, project_id)
+    assert await project_counts(db, project_id) == (2, 1)
+
+    await db.execute("DELETE FROM documents WHERE id = $1", document_ids[0])
+    assert await project_counts(db, project_id) == (1, 1)
+
+
+@pytest.mark.integration
+async def test_project_counts_follow_moved_sessions(db):
+    """Moving a session to another project moves it between the counters."""
+    source_id = await create_project(db, "source")
+    target_id = await create_project(db, "target")
+    session_id = await create_session(db, source_id)
+
+    await db.execute("UPDATE chat_sessions SET project_id = $1 WHERE id = $2", target_id, session_id)
+
+    assert await project_counts(db, source_id) == (0, 0)
+    assert await project_counts(db, target_id) == (0, 1)
+
+
+@pytest.mark.integration
+async def test_session_message_count_follows_messages(db):
+    """Adding and deleting messages adjusts the session's message_count."""
+    session_id = await create_session(db, await create_project(db))
+
+    message_ids = [await add_message(db, session_id) for _ in range(3)]
+    await db.execute("DELETE FROM chat_messages WHERE id = $1", message_ids[0])
+
+    assert await db.fetchval(
+        "SELECT message_count FROM chat_sessions WHERE id = $1", session_id
+    ) == 2
+
+
+@pytest.mark.integration
+async def test_messages_leave_project_timestamp_alone(db):
+    """Message count updates don't touch the project; renaming the session does."""
+    project_id = await create_project(db)
+    session_id = await create_session(db, project_id)
+    await db.execute("UPDATE projects SET updated_at = '2000-01-01' WHERE id = $1", project_id)
+
+    await add_message(db, session_id)
+    assert await db.fetchval(
+        "SELECT updated_at::date = '2000-01-01' FROM projects WHERE id = $1", project_id
+    )
+
+    await db.execute("UPDATE chat_sessions SET title = 'Renamed' WHERE id = $1", session_id)
+    assert not await db.fetchval(
+        "SELECT updated_at::date = '2000-01-01' FROM projects WHERE id = $1", project_id
+    )